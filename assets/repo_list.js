@@ -0,0 +1,983 @@
+// Repository data is shipped column by column; rebuild one object per repo
+function fromColumns(columns) {
+    const fields = Object.keys(columns);
+    const count = fields.length ? columns[fields[0]].length : 0;
+    const rows = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const row = {};
+        for (const field of fields) row[field] = columns[field][i];
+        rows[i] = row;
+    }
+    return rows;
+}
+
+// Derive the date-based fields and activity buckets once at load instead
+// of parsing dates and comparing ages in every filter, sort and render pass
+function annotateRepos(list) {
+    const nowSeconds = Date.now() / 1000;
+    for (const repo of list) {
+        const yearsSinceUpdate = repo.updated_ts ? (nowSeconds - repo.updated_ts) / (60 * 60 * 24 * 365.25) : 0;
+        repo.inactive_1yr = yearsSinceUpdate >= 1;
+        repo.inactive_3yr = yearsSinceUpdate >= 3;
+        repo.level_class = repo.level === null || repo.level === undefined ? null :
+                           repo.level >= 4 ? 'level-4' :
+                           repo.level >= 3 ? 'level-3' :
+                           repo.level >= 2 ? 'level-2' : 'level-1';
+        repo.created_year = repo.created_ts ? new Date(repo.created_ts * 1000).getFullYear() : null;
+        // Lowercased searchable fields, separated so a term never spans two of them
+        repo.search_text = [repo.name, repo.description, repo.title, repo.pitch, ...(repo.tags || [])]
+            .filter(Boolean).join('\n').toLowerCase();
+    }
+    return list;
+}
+
+// Weekly commit counts arrive as one base64 string of LEB128 varints;
+// decode them into a single typed array and give each repo a view of it
+function unpackSparklines(list, packed, weeks) {
+    const bytes = atob(packed);
+    const values = new Uint32Array(weeks.reduce((a, b) => a + b, 0));
+    let pos = 0;
+    for (let i = 0; i < values.length; i++) {
+        let value = 0, shift = 0, byte;
+        do {
+            byte = bytes.charCodeAt(pos++);
+            value += (byte & 0x7f) * 2 ** shift;
+            shift += 7;
+        } while (byte & 0x80);
+        values[i] = value;
+    }
+    let offset = 0;
+    list.forEach((repo, i) => {
+        repo.sparkline = values.subarray(offset, offset += weeks[i]);
+    });
+}
+
+function loadRepos(data) {
+    for (const [field, values] of Object.entries(data.dictionaries)) {
+        data.columns[field] = data.columns[field].map(index => values[index]);
+    }
+    const list = fromColumns(data.columns);
+    unpackSparklines(list, data.sparklines, data.columns.sparkline_weeks);
+    return annotateRepos(list);
+}
+
+let currentFilter = 'all';
+let currentSort = 'activity-desc';
+let searchTerm = '';
+let activityFilter = 'all';
+let hideArchived = true;
+let viewMode = 'cards';
+let creationYearFilter = null;
+
+// One shared formatter: toLocaleDateString() with options builds a new
+// one on every call, which dominated building the table rows
+const dateFormat = new Intl.DateTimeFormat('en-US', { year: 'numeric', month: 'short', day: 'numeric' });
+
+// Both take Unix seconds (the records' *_ts fields); 0 means unknown
+function formatDate(timestamp) {
+    if (!timestamp) return 'N/A';
+    return dateFormat.format(timestamp * 1000);
+}
+
+function getTimeAgo(timestamp) {
+    if (!timestamp) return '';
+    const diffMs = Date.now() - timestamp * 1000;
+    const diffSeconds = Math.floor(diffMs / 1000);
+    const diffMinutes = Math.floor(diffSeconds / 60);
+    const diffHours = Math.floor(diffMinutes / 60);
+    const diffDays = Math.floor(diffHours / 24);
+    const diffWeeks = Math.floor(diffDays / 7);
+    const diffMonths = Math.floor(diffDays / 30);
+    const diffYears = Math.floor(diffDays / 365);
+
+    if (diffYears > 0) {
+        return diffYears === 1 ? '1 year ago' : `${diffYears} years ago`;
+    } else if (diffMonths > 0) {
+        return diffMonths === 1 ? '1 month ago' : `${diffMonths} months ago`;
+    } else if (diffWeeks > 0) {
+        return diffWeeks === 1 ? '1 week ago' : `${diffWeeks} weeks ago`;
+    } else if (diffDays > 0) {
+        return diffDays === 1 ? '1 day ago' : `${diffDays} days ago`;
+    } else if (diffHours > 0) {
+        return diffHours === 1 ? '1 hour ago' : `${diffHours} hours ago`;
+    } else if (diffMinutes > 0) {
+        return diffMinutes === 1 ? '1 minute ago' : `${diffMinutes} minutes ago`;
+    } else {
+        return 'just now';
+    }
+}
+
+
+// Path geometry shared by the sparkline markup and the card's SVG nodes;
+// returns null when there is no activity data
+function sparklineShape(data, width, height, peak, total) {
+    if (!data || data.length === 0) return null;
+
+    // The generator precomputes each repo's peak week and commit total
+    let max = peak, totalCommits = total;
+    if (max === undefined || totalCommits === undefined) {
+        max = 0;
+        totalCommits = 0;
+        for (let i = 0; i < data.length; i++) {
+            if (data[i] > max) max = data[i];
+            totalCommits += data[i];
+        }
+    }
+    max = Math.max(max, 1);
+    const divisor = data.length > 1 ? data.length - 1 : 1;
+    const toY = value => Math.round(height - (value / max) * height);
+
+    // One pass builds the points, snapped to the pixel grid; the middle
+    // of a flat run draws the same line, so it is dropped
+    const segments = [];
+    let prevY = null;
+    let y = toY(data[0]);
+    for (let i = 0; i < data.length; i++) {
+        const nextY = i + 1 < data.length ? toY(data[i + 1]) : null;
+        if (y !== prevY || y !== nextY) {
+            segments.push(`${Math.round((i / divisor) * width)},${y}`);
+        }
+        prevY = y;
+        y = nextY;
+    }
+    const line = segments.join(' L');
+
+    return {
+        fill: `M0,${height} L${line} L${width},${height} Z`,
+        stroke: `M${line}`,
+        title: `${totalCommits} commits in the last 52 weeks`,
+    };
+}
+
+// The sparkline as an SVG element, for the card and table row templates
+function createSparklineNode(data, width, height, peak, total) {
+    const shape = sparklineShape(data, width, height, peak, total);
+    if (!shape) {
+        const label = createElement('span', 'sparkline-label', 'No activity data');
+        label.style.color = '#bdc3c7';
+        return label;
+    }
+
+    const svg = document.createElementNS(SVG_NS, 'svg');
+    svg.setAttribute('class', 'sparkline-svg');
+    svg.setAttribute('width', width);
+    svg.setAttribute('height', height);
+    svg.setAttribute('viewBox', `0 0 ${width} ${height}`);
+    svg.setAttribute('title', shape.title);
+    const title = document.createElementNS(SVG_NS, 'title');
+    title.textContent = shape.title;
+    svg.appendChild(title);
+    for (const [className, d] of [['sparkline-fill', shape.fill], ['sparkline', shape.stroke]]) {
+        const path = document.createElementNS(SVG_NS, 'path');
+        path.setAttribute('class', className);
+        path.setAttribute('d', d);
+        svg.appendChild(path);
+    }
+    return svg;
+}
+
+// Query string for the "bump" reminder issue, encoded once for every card
+const BUMP_ISSUE_QUERY = '/issues/new?title=' + encodeURIComponent('Repository Activity Reminder') + '&body=' + encodeURIComponent(
+`Hello from the OWASP BLT team! 👋
+
+We noticed that this repository hasn't seen much activity recently. We wanted to reach out to check on the status of this project.
+
+**Please consider one of the following actions:**
+- ✅ If this project is still active, please update it with any recent changes or a simple commit to show it's maintained
+- 📦 If this project is no longer maintained, please consider archiving it to help keep the OWASP organization tidy
+- 💬 If you need help or resources, please let us know in the comments
+
+Thank you for contributing to the OWASP community!
+
+---
+*This issue was created via the [OWASP Bumper](https://github.com/OWASP-BLT/OWASP-Bumper) tool to help keep track of repository activity.*`
+);
+
+// Filter controls, looked up once instead of on every click
+const FILTER_BUTTONS = {
+    all: document.getElementById('filterAll'),
+    project: document.getElementById('filterProject'),
+    chapter: document.getElementById('filterChapter'),
+    other: document.getElementById('filterOther'),
+};
+const ACTIVITY_FILTER_STATS = {
+    'within-year': document.getElementById('filterActiveYear'),
+    '1yr-old': document.getElementById('filterInactive1yr'),
+    '3yr-old': document.getElementById('filterInactive3yr'),
+};
+
+// Elements the renderers use for every card, row and scroll frame
+const REPO_LIST = document.getElementById('repoList');
+const VISIBLE_COUNT = document.getElementById('visibleCount');
+const CARD_TEMPLATE = document.getElementById('repoCardTemplate').content.firstElementChild;
+const ROW_TEMPLATE = document.getElementById('repoRowTemplate').content.firstElementChild;
+
+function setFilter(filter) {
+    currentFilter = filter;
+
+    // Update button states
+    for (const [key, btn] of Object.entries(FILTER_BUTTONS)) {
+        btn.classList.toggle('active', key === filter);
+    }
+
+    scheduleRender();
+}
+
+function setActivityFilter(filter) {
+    // Toggle filter - if clicking the same one, clear it
+    if (activityFilter === filter) {
+        activityFilter = 'all';
+    } else {
+        activityFilter = filter;
+    }
+
+    // Update button states
+    for (const [key, stat] of Object.entries(ACTIVITY_FILTER_STATS)) {
+        stat.classList.toggle('active', key === activityFilter);
+    }
+
+    scheduleRender();
+}
+
+function setCreationYearFilter(year) {
+    // Toggle filter - if clicking the same year or passing null, clear it
+    if (year === null || creationYearFilter === year) {
+        creationYearFilter = null;
+    } else {
+        creationYearFilter = year;
+    }
+    renderCreationChart();
+    scheduleRender();
+}
+
+function toggleHideArchived() {
+    hideArchived = document.getElementById('hideArchived').checked;
+    scheduleRender();
+}
+
+function setViewMode(mode) {
+    viewMode = mode;
+    document.getElementById('viewCards').classList.toggle('active', mode === 'cards');
+    document.getElementById('viewTable').classList.toggle('active', mode === 'table');
+    scheduleRender();
+}
+
+function getSortArrow(colKey) {
+    if (currentSort === colKey + '-desc') return '↓';
+    if (currentSort === colKey + '-asc') return '↑';
+    return '⇅';
+}
+
+function sortByColumn(colKey) {
+    if (currentSort === colKey + '-desc') {
+        currentSort = colKey + '-asc';
+    } else {
+        currentSort = colKey + '-desc';
+    }
+    document.querySelectorAll('.sort-btn').forEach(b => {
+        b.classList.toggle('active', b.dataset.sort === currentSort);
+    });
+    scheduleRender();
+}
+
+// Sorted copies are kept per sort key, so a search or filter change
+// reuses the current order instead of sorting the whole list again
+const sortCache = new Map();
+let sortCacheSource = null;
+const nameCollator = new Intl.Collator();
+
+// One comparator per sort key, so each sort call sees a single function
+const COMPARATORS = {
+    'updated-desc': (a, b) => b.updated_ts - a.updated_ts,
+    'updated-asc': (a, b) => a.updated_ts - b.updated_ts,
+    'created-desc': (a, b) => b.created_ts - a.created_ts,
+    'created-asc': (a, b) => a.created_ts - b.created_ts,
+    'name-asc': (a, b) => nameCollator.compare(a.name, b.name),
+    'name-desc': (a, b) => nameCollator.compare(b.name, a.name),
+    'stars-desc': (a, b) => b.stargazers_count - a.stargazers_count,
+    'stars-asc': (a, b) => a.stargazers_count - b.stargazers_count,
+    'forks-desc': (a, b) => b.forks_count - a.forks_count,
+    'forks-asc': (a, b) => a.forks_count - b.forks_count,
+    'activity-desc': (a, b) => b.activity_score - a.activity_score,
+    'activity-asc': (a, b) => a.activity_score - b.activity_score,
+    'prs-desc': (a, b) => (b.open_prs_count || 0) - (a.open_prs_count || 0),
+    'prs-asc': (a, b) => (a.open_prs_count || 0) - (b.open_prs_count || 0),
+    'issues-desc': (a, b) => b.open_issues_count - a.open_issues_count,
+    'issues-asc': (a, b) => a.open_issues_count - b.open_issues_count,
+    'level-desc': (a, b) => (b.level || 0) - (a.level || 0),
+    'level-asc': (a, b) => (a.level || 0) - (b.level || 0),
+};
+
+function sortRepos(repos, sortBy) {
+    if (sortCacheSource !== repos) {
+        sortCache.clear();
+        sortCacheSource = repos;
+    }
+    const cached = sortCache.get(sortBy);
+    if (cached) return cached;
+
+    const sorted = [...repos];
+    const compare = COMPARATORS[sortBy];
+    if (compare) sorted.sort(compare);
+    sortCache.set(sortBy, sorted);
+    return sorted;
+}
+
+// The previous filter result; while only the search term grows
+// (typing), the next result is always a subset of it
+let lastFiltered = null;
+
+function filterRepos(repos) {
+    const term = searchTerm ? searchTerm.toLowerCase() : '';
+    const key = `${hideArchived}|${currentFilter}|${activityFilter}|${creationYearFilter}`;
+
+    if (lastFiltered && lastFiltered.source === repos && lastFiltered.key === key && term.startsWith(lastFiltered.term)) {
+        const result = term === lastFiltered.term
+            ? lastFiltered.result
+            : lastFiltered.result.filter(repo => repo.search_text.includes(term));
+        lastFiltered = { source: repos, key, term, result };
+        return result;
+    }
+
+    // Apply every active filter in a single pass over the list
+    const result = repos.filter(repo => {
+        // Hide archived filter
+        if (hideArchived && repo.archived) return false;
+
+        // Type filter
+        if (currentFilter === 'project') {
+            if (!repo.is_project) return false;
+        } else if (currentFilter === 'chapter') {
+            if (!repo.is_chapter) return false;
+        } else if (currentFilter === 'other') {
+            if (repo.is_project || repo.is_chapter) return false;
+        }
+
+        // Activity filter
+        if (activityFilter === 'within-year') {
+            if (repo.inactive_1yr) return false;
+        } else if (activityFilter === '1yr-old') {
+            if (!repo.inactive_1yr) return false;
+        } else if (activityFilter === '3yr-old') {
+            if (!repo.inactive_3yr) return false;
+        }
+
+        // Creation year filter
+        if (creationYearFilter !== null && repo.created_year !== creationYearFilter) return false;
+
+        // Search
+        return !term || repo.search_text.includes(term);
+    });
+    lastFiltered = { source: repos, key, term, result };
+    return result;
+}
+
+const SVG_NS = 'http://www.w3.org/2000/svg';
+
+function createElement(tag, className, text) {
+    const el = document.createElement(tag);
+    if (className) el.className = className;
+    if (text !== undefined) el.textContent = text;
+    return el;
+}
+
+function createLink(href, className, text) {
+    const link = createElement('a', className, text);
+    link.href = href;
+    link.target = '_blank';
+    return link;
+}
+
+// Cards are cloned from the #repoCardTemplate skeleton and filled in with
+// textContent and attributes, so no HTML is parsed and nothing needs escaping
+function renderCard(repo) {
+    const card = CARD_TEMPLATE.cloneNode(true);
+    const slots = {};
+    for (const el of card.querySelectorAll('[data-bind]')) slots[el.dataset.bind] = el;
+
+    if (repo.archived) card.classList.add('archived');
+
+    slots.name.href = repo.html_url;
+    slots.name.textContent = repo.name;
+
+    // Display title if different from name
+    if (repo.title && repo.title !== repo.name) {
+        slots.title.textContent = repo.title;
+        slots.title.title = repo.title;
+    } else {
+        slots.title.remove();
+    }
+
+    // Level badge
+    const badges = slots.badges;
+    if (repo.level_class) {
+        const level = createElement('span', `badge level ${repo.level_class}`, `L${repo.level}`);
+        level.title = `OWASP Level ${repo.level}`;
+        badges.appendChild(level);
+    }
+
+    if (repo.is_project) badges.appendChild(createElement('span', 'badge project', 'Project'));
+    if (repo.is_chapter) badges.appendChild(createElement('span', 'badge chapter', 'Chapter'));
+    if (repo.archived) badges.appendChild(createElement('span', 'badge archived', 'Archived'));
+    if (repo.language && repo.language !== 'N/A') {
+        badges.appendChild(createElement('span', 'badge language', repo.language));
+    }
+
+    // Add activity indicator badges
+    if (repo.inactive_3yr) {
+        const badge = createElement('span', 'badge inactive-3yr', '3yr+');
+        badge.title = 'No activity in 3+ years';
+        badges.appendChild(badge);
+    } else if (repo.inactive_1yr) {
+        const badge = createElement('span', 'badge inactive-1yr', '1yr+');
+        badge.title = 'No activity in 1+ year';
+        badges.appendChild(badge);
+    }
+
+    // Only show bump button for repos not updated in over 1 year (and not archived)
+    if (repo.inactive_1yr) {
+        const bump = repo.archived
+            ? createElement('span', 'bump-btn archived', '🔔')
+            : createLink(repo.html_url + BUMP_ISSUE_QUERY, 'bump-btn', '🔔');
+        bump.title = repo.archived ? 'Cannot bump archived repositories' : 'Create a reminder issue in this repository';
+        badges.appendChild(bump);
+    }
+
+    // Display pitch if available, the description otherwise
+    if (repo.pitch) {
+        slots.pitch.textContent = repo.pitch;
+        slots.pitch.title = repo.pitch;
+        slots.description.remove();
+    } else {
+        slots.description.textContent = repo.description || 'No description';
+        slots.pitch.remove();
+    }
+
+    // Display tags
+    if (repo.tags && repo.tags.length > 0) {
+        for (const tag of repo.tags.slice(0, 5)) slots.tags.appendChild(createElement('span', 'badge tag', tag));
+    } else {
+        slots.tags.remove();
+    }
+
+    slots.stars.textContent = `⭐ ${repo.stargazers_count}`;
+    slots.forks.textContent = `🔱 ${repo.forks_count}`;
+    slots.issues.textContent = `📝 ${repo.open_issues_count}`;
+    if (repo.open_prs_count > 0) {
+        slots.prs.textContent = `🔀 ${repo.open_prs_count} PRs`;
+    } else {
+        slots.prs.remove();
+    }
+    slots.updated.textContent = `📅 ${getTimeAgo(repo.updated_ts)}`;
+
+    // Last commit section
+    if (repo.last_commit_message || repo.last_commit_author) {
+        const lastCommit = slots.lastCommit;
+        if (repo.last_commit_avatar_url) {
+            const avatar = createElement('img', 'last-commit-avatar');
+            // Set loading before src, or a detached image starts fetching at once
+            avatar.loading = 'lazy';
+            avatar.src = repo.last_commit_avatar_url;
+            avatar.alt = repo.last_commit_author || '';
+            lastCommit.appendChild(avatar);
+        } else {
+            lastCommit.append('💬');
+        }
+        if (repo.last_commit_author) {
+            if (repo.last_commit_author_url) {
+                const author = createLink(repo.last_commit_author_url, 'last-commit-author', repo.last_commit_author);
+                author.rel = 'noopener noreferrer';
+                lastCommit.appendChild(author);
+            } else {
+                lastCommit.appendChild(createElement('span', 'last-commit-author', repo.last_commit_author));
+            }
+        }
+        const message = createElement('span', 'last-commit-message', repo.last_commit_message || '');
+        message.title = repo.last_commit_message || '';
+        lastCommit.appendChild(message);
+    } else {
+        slots.lastCommit.remove();
+    }
+
+    slots.sparkline.replaceWith(createSparklineNode(repo.sparkline, 80, 16, repo.sparkline_peak, repo.activity_score));
+    slots.score.textContent = `Score: ${repo.activity_score}`;
+
+    // The bindings are only needed while filling the clone
+    for (const el of Object.values(slots)) el.removeAttribute('data-bind');
+    return card;
+}
+
+// Card view virtualization: only the grid rows around the viewport are
+// in the DOM, with padding standing in for the rows above and below.
+const CARD_OVERSCAN_ROWS = 4;
+const cardNodes = new Map();
+let cardList = [];
+let cardWindow = null;
+let cardRowPitch = 220;
+let cardWindowFrame = 0;
+
+function getCardNode(repo) {
+    let node = cardNodes.get(repo.full_name);
+    if (!node) {
+        node = renderCard(repo);
+        cardNodes.set(repo.full_name, node);
+    }
+    return node;
+}
+
+function getCardColumns(container) {
+    const columns = getComputedStyle(container).gridTemplateColumns;
+    return columns && columns !== 'none' ? columns.split(' ').length : 1;
+}
+
+function renderCardWindow() {
+    const container = REPO_LIST;
+    const columns = getCardColumns(container);
+    const totalRows = Math.ceil(cardList.length / columns);
+    const windowRows = Math.ceil(window.innerHeight / cardRowPitch) + 2 * CARD_OVERSCAN_ROWS;
+    const viewTop = Math.max(0, -container.getBoundingClientRect().top);
+    const lastRow = Math.min(totalRows, Math.max(0, Math.floor(viewTop / cardRowPitch) - CARD_OVERSCAN_ROWS) + windowRows);
+    const firstRow = Math.max(0, lastRow - windowRows);
+
+    const key = `${firstRow}:${lastRow}:${columns}`;
+    if (key === cardWindow) return;
+    cardWindow = key;
+
+    const paddingTop = firstRow * cardRowPitch;
+    const paddingBottom = (totalRows - lastRow) * cardRowPitch;
+    container.style.paddingTop = `${paddingTop}px`;
+    container.style.paddingBottom = `${paddingBottom}px`;
+    container.replaceChildren(...cardList.slice(firstRow * columns, lastRow * columns).map(getCardNode));
+
+    // Refine the row height estimate from the rows just rendered
+    const renderedRows = lastRow - firstRow;
+    const rowGap = parseFloat(getComputedStyle(container).rowGap) || 0;
+    const contentHeight = container.getBoundingClientRect().height - paddingTop - paddingBottom;
+    if (renderedRows > 0 && contentHeight > 0) {
+        cardRowPitch = (contentHeight + rowGap) / renderedRows;
+    }
+}
+
+function scheduleCardWindow() {
+    if (cardWindowFrame || viewMode !== 'cards' || cardList.length === 0) return;
+    cardWindowFrame = requestAnimationFrame(() => {
+        cardWindowFrame = 0;
+        renderCardWindow();
+    });
+}
+
+function resetCardWindow(container) {
+    cardList = [];
+    cardWindow = null;
+    container.style.paddingTop = '';
+    container.style.paddingBottom = '';
+}
+
+function renderCards(filtered) {
+    const container = REPO_LIST;
+    container.className = 'repo-list';
+    resetTableWindow();
+
+    if (filtered.length === 0) {
+        resetCardWindow(container);
+        container.innerHTML = '<div class="no-results">No repositories match your criteria</div>';
+        VISIBLE_COUNT.textContent = '0';
+        return;
+    }
+
+    cardList = filtered;
+    cardWindow = null;
+    renderCardWindow();
+
+    VISIBLE_COUNT.textContent = filtered.length;
+}
+
+// Table rows are cloned from #repoRowTemplate like the cards
+function renderTableRow(repo) {
+    const row = ROW_TEMPLATE.cloneNode(true);
+    const slots = {};
+    for (const el of row.querySelectorAll('[data-bind]')) slots[el.dataset.bind] = el;
+
+    if (repo.archived) row.classList.add('archived');
+
+    slots.name.href = repo.html_url;
+    slots.name.textContent = repo.name;
+
+    // Title (if different from name)
+    if (repo.title && repo.title !== repo.name) {
+        slots.title.textContent = repo.title;
+        slots.title.title = repo.title;
+    } else {
+        slots.title.remove();
+    }
+
+    // Type badges
+    const badges = slots.badges;
+    if (repo.is_project) badges.appendChild(createElement('span', 'badge project', 'Project'));
+    if (repo.is_chapter) badges.appendChild(createElement('span', 'badge chapter', 'Chapter'));
+    if (repo.archived) badges.appendChild(createElement('span', 'badge archived', 'Archived'));
+    if (repo.inactive_3yr) {
+        const badge = createElement('span', 'badge inactive-3yr', '3yr+');
+        badge.title = 'No activity in 3+ years';
+        badges.appendChild(badge);
+    } else if (repo.inactive_1yr) {
+        const badge = createElement('span', 'badge inactive-1yr', '1yr+');
+        badge.title = 'No activity in 1+ year';
+        badges.appendChild(badge);
+    }
+
+    // Description (prefer pitch, fall back to description)
+    const descText = repo.pitch || repo.description || 'No description';
+    slots.description.textContent = descText;
+    slots.description.title = descText;
+
+    // Tags (up to 4)
+    if (repo.tags) {
+        for (const tag of repo.tags.slice(0, 4)) slots.tags.appendChild(createElement('span', 'badge tag', tag));
+    }
+
+    if (repo.language && repo.language !== 'N/A') {
+        slots.language.appendChild(createElement('span', 'badge language', repo.language));
+    }
+
+    // Level badge
+    if (repo.level_class) {
+        const level = createElement('span', `badge level ${repo.level_class}`, `L${repo.level}`);
+        level.title = `OWASP Level ${repo.level}`;
+        slots.level.appendChild(level);
+    }
+
+    slots.stars.textContent = repo.stargazers_count;
+    slots.forks.textContent = repo.forks_count;
+    slots.issues.textContent = repo.open_issues_count;
+    // null when the generator could not fetch the count
+    slots.prs.textContent = repo.open_prs_count ?? 'N/A';
+    slots.sparkline.replaceWith(createSparklineNode(repo.sparkline, 60, 14, repo.sparkline_peak, repo.activity_score));
+    slots.score.textContent = repo.activity_score;
+    slots.updated.textContent = getTimeAgo(repo.updated_ts);
+    slots.created.textContent = formatDate(repo.created_ts);
+
+    // Last commit cell
+    if (repo.last_commit_message || repo.last_commit_author) {
+        const cell = createElement('div', 'last-commit-cell');
+        if (repo.last_commit_avatar_url) {
+            const avatar = createElement('img', 'last-commit-avatar');
+            // Set loading before src, or a detached image starts fetching at once
+            avatar.loading = 'lazy';
+            avatar.src = repo.last_commit_avatar_url;
+            avatar.alt = repo.last_commit_author;
+            cell.append(avatar, ' ');
+        }
+        const text = createElement('span', 'last-commit-cell-text');
+        text.title = repo.last_commit_author + (repo.last_commit_message ? ': ' + repo.last_commit_message : '');
+        if (repo.last_commit_author) {
+            if (repo.last_commit_author_url) {
+                const author = createLink(repo.last_commit_author_url, 'last-commit-author', repo.last_commit_author);
+                author.rel = 'noopener noreferrer';
+                text.appendChild(author);
+            } else {
+                text.appendChild(createElement('span', 'last-commit-author', repo.last_commit_author));
+            }
+            text.append(': ');
+        }
+        text.append(repo.last_commit_message || '');
+        cell.appendChild(text);
+        slots.lastCommit.appendChild(cell);
+    }
+
+    // Bump button
+    if (repo.inactive_1yr) {
+        const bump = repo.archived
+            ? createElement('span', 'bump-btn archived', '🔔')
+            : createLink(repo.html_url + BUMP_ISSUE_QUERY, 'bump-btn', '🔔');
+        bump.title = repo.archived ? 'Cannot bump archived repositories' : 'Create a reminder issue in this repository';
+        slots.bump.appendChild(bump);
+    }
+
+    for (const el of row.querySelectorAll('[data-bind]')) el.removeAttribute('data-bind');
+    return row;
+}
+
+// A row only depends on its repository, so like the card nodes it is
+// built once and reused by every later render
+const tableRowNodes = new Map();
+
+function getTableRowNode(repo) {
+    let row = tableRowNodes.get(repo.full_name);
+    if (!row) {
+        row = renderTableRow(repo);
+        tableRowNodes.set(repo.full_name, row);
+    }
+    return row;
+}
+
+// The table is windowed like the cards: only the rows near the
+// viewport are in the document, with spacer rows standing in for the rest
+const TABLE_OVERSCAN_ROWS = 10;
+let tableList = [];
+let tableWindow = null;
+let tableRowHeight = 45;
+let tableWindowFrame = 0;
+// The current table's body and header cells, set by renderTable()
+let tableBody = null;
+let tableHeaders = [];
+
+function createTableSpacer(height) {
+    const spacer = createElement('tr', 'table-spacer');
+    spacer.setAttribute('aria-hidden', 'true');
+    const cell = createElement('td');
+    cell.colSpan = 15;
+    cell.style.height = `${height}px`;
+    spacer.appendChild(cell);
+    return spacer;
+}
+
+function renderTableWindow() {
+    const tbody = tableBody;
+    const windowRows = Math.ceil(window.innerHeight / tableRowHeight) + 2 * TABLE_OVERSCAN_ROWS;
+    const viewTop = Math.max(0, -tbody.getBoundingClientRect().top);
+    const lastRow = Math.min(tableList.length, Math.max(0, Math.floor(viewTop / tableRowHeight) - TABLE_OVERSCAN_ROWS) + windowRows);
+    const firstRow = Math.max(0, lastRow - windowRows);
+
+    const key = `${firstRow}:${lastRow}`;
+    if (key === tableWindow) return;
+    tableWindow = key;
+
+    const paddingTop = firstRow * tableRowHeight;
+    const paddingBottom = (tableList.length - lastRow) * tableRowHeight;
+    const rows = [createTableSpacer(paddingTop)];
+    for (let i = firstRow; i < lastRow; i++) rows.push(getTableRowNode(tableList[i]));
+    rows.push(createTableSpacer(paddingBottom));
+    tbody.replaceChildren(...rows);
+
+    // Refine the row height estimate from the rows just rendered
+    const renderedRows = lastRow - firstRow;
+    const contentHeight = tbody.getBoundingClientRect().height - paddingTop - paddingBottom;
+    if (renderedRows > 0 && contentHeight > 0) {
+        tableRowHeight = contentHeight / renderedRows;
+    }
+
+    // Let columns widen for the rows now shown but never narrow again,
+    // so the table does not jitter as different rows scroll in
+    for (const th of tableHeaders) {
+        const width = th.getBoundingClientRect().width;
+        if (width > (parseFloat(th.style.minWidth) || 0)) th.style.minWidth = `${width}px`;
+    }
+}
+
+function scheduleTableWindow() {
+    if (tableWindowFrame || viewMode !== 'table' || tableList.length === 0) return;
+    tableWindowFrame = requestAnimationFrame(() => {
+        tableWindowFrame = 0;
+        renderTableWindow();
+    });
+}
+
+function resetTableWindow() {
+    tableList = [];
+    tableWindow = null;
+}
+
+function renderTable(filtered) {
+    const container = REPO_LIST;
+    container.className = '';
+    resetCardWindow(container);
+    resetTableWindow();
+
+    if (filtered.length === 0) {
+        container.innerHTML = '<div class="no-results">No repositories match your criteria</div>';
+        VISIBLE_COUNT.textContent = '0';
+        return;
+    }
+
+    const columns = [
+        { key: 'name',        label: 'Name',        sortKey: 'name' },
+        { key: 'type',        label: 'Type',        sortKey: null },
+        { key: 'description', label: 'Description', sortKey: null },
+        { key: 'tags',        label: 'Tags',        sortKey: null },
+        { key: 'language',    label: 'Language',    sortKey: null },
+        { key: 'level',       label: 'Level',       sortKey: 'level' },
+        { key: 'stars',       label: '⭐ Stars',    sortKey: 'stars' },
+        { key: 'forks',       label: '🔱 Forks',   sortKey: 'forks' },
+        { key: 'issues',      label: '📝 Issues',  sortKey: 'issues' },
+        { key: 'prs',         label: '🔀 PRs',     sortKey: 'prs' },
+        { key: 'activity',    label: '📈 Activity', sortKey: 'activity' },
+        { key: 'updated',     label: '📅 Updated',  sortKey: 'updated' },
+        { key: 'created',     label: '📅 Created',  sortKey: 'created' },
+        { key: 'lastcommit',  label: '💬 Last Commit', sortKey: null },
+        { key: 'bump',        label: 'Bump',        sortKey: null },
+    ];
+
+    const thead = columns.map(col => {
+        if (col.sortKey) {
+            const isActive = currentSort.startsWith(col.sortKey + '-');
+            const arrow = getSortArrow(col.sortKey);
+            return `<th class="sortable${isActive ? ' sort-active' : ''}" onclick="sortByColumn('${col.sortKey}')">${col.label} <span class="sort-arrow">${arrow}</span></th>`;
+        }
+        return `<th>${col.label}</th>`;
+    }).join('');
+
+    container.innerHTML = `<div class="table-wrapper"><table class="repo-table"><thead><tr>${thead}</tr></thead><tbody id="repoTableBody"></tbody></table></div>`;
+    tableBody = container.querySelector('tbody');
+    tableHeaders = [...container.querySelectorAll('th')];
+    tableList = filtered;
+    renderTableWindow();
+    VISIBLE_COUNT.textContent = filtered.length;
+}
+
+function renderRepos() {
+    const sorted = sortRepos(repos, currentSort);
+    const filtered = filterRepos(sorted);
+    if (viewMode === 'table') {
+        renderTable(filtered);
+    } else {
+        renderCards(filtered);
+    }
+}
+
+// Coalesce filter, sort and search changes into one render per frame
+let renderFrame = 0;
+function scheduleRender() {
+    if (renderFrame) return;
+    renderFrame = requestAnimationFrame(() => {
+        renderFrame = 0;
+        renderRepos();
+    });
+}
+
+function updateStats() {
+    const totalRepos = repos.length;
+    let archivedRepos = 0;
+    let totalProjects = 0, archivedProjects = 0;
+    let totalChapters = 0, archivedChapters = 0;
+    let activeWithinYear = 0, olderThan1Year = 0, olderThan3Years = 0;
+
+    for (const r of repos) {
+        if (r.archived) archivedRepos++;
+        if (r.is_project) {
+            totalProjects++;
+            if (r.archived) archivedProjects++;
+        }
+        if (r.is_chapter) {
+            totalChapters++;
+            if (r.archived) archivedChapters++;
+        }
+
+        // Activity-based counts
+        if (r.inactive_1yr) {
+            olderThan1Year++;
+            if (r.inactive_3yr) olderThan3Years++;
+        } else {
+            activeWithinYear++;
+        }
+    }
+
+    const activeRepos = totalRepos - archivedRepos;
+    const activeProjects = totalProjects - archivedProjects;
+    const activeChapters = totalChapters - archivedChapters;
+
+    document.getElementById('totalCount').textContent = totalRepos;
+    VISIBLE_COUNT.textContent = totalRepos;
+    document.getElementById('activeReposCount').textContent = activeRepos;
+    document.getElementById('archivedReposCount').textContent = archivedRepos;
+
+    document.getElementById('projectCount').textContent = totalProjects;
+    document.getElementById('activeProjectsCount').textContent = activeProjects;
+    document.getElementById('archivedProjectsCount').textContent = archivedProjects;
+
+    document.getElementById('chapterCount').textContent = totalChapters;
+    document.getElementById('activeChaptersCount').textContent = activeChapters;
+    document.getElementById('archivedChaptersCount').textContent = archivedChapters;
+
+    // Update activity-based counts
+    document.getElementById('activeYearCount').textContent = activeWithinYear;
+    document.getElementById('inactive1yrCount').textContent = olderThan1Year;
+    document.getElementById('inactive3yrCount').textContent = olderThan3Years;
+}
+
+// Event listeners
+// Wait for a pause in typing so a burst of keystrokes renders once
+const SEARCH_DEBOUNCE_MS = 60;
+let searchTimer = 0;
+document.getElementById('searchInput').addEventListener('input', (e) => {
+    searchTerm = e.target.value;
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(scheduleRender, SEARCH_DEBOUNCE_MS);
+});
+
+window.addEventListener('scroll', scheduleCardWindow, { passive: true });
+window.addEventListener('resize', scheduleCardWindow);
+window.addEventListener('scroll', scheduleTableWindow, { passive: true });
+window.addEventListener('resize', scheduleTableWindow);
+
+// Sort button event listeners
+document.querySelectorAll('.sort-btn').forEach(btn => {
+    btn.addEventListener('click', (e) => {
+        document.querySelectorAll('.sort-btn').forEach(b => b.classList.remove('active'));
+        e.target.classList.add('active');
+        currentSort = e.target.dataset.sort;
+        scheduleRender();
+    });
+});
+
+function renderCreationChart() {
+    const yearCounts = {};
+    repos.forEach(repo => {
+        if (repo.created_year !== null) {
+            yearCounts[repo.created_year] = (yearCounts[repo.created_year] || 0) + 1;
+        }
+    });
+
+    const years = Object.keys(yearCounts).sort();
+    if (years.length === 0) return;
+
+    const counts = years.map(y => yearCounts[y]);
+    const maxCount = Math.max(...counts);
+
+    const barWidth = 44;
+    const barGap = 10;
+    const chartHeight = 130;
+    const topPadding = 20;
+    const labelHeight = 22;
+    const svgWidth = years.length * (barWidth + barGap) + barGap;
+    const svgHeight = topPadding + chartHeight + labelHeight;
+
+    const hasSelection = creationYearFilter !== null;
+
+    const bars = years.map((year, i) => {
+        const count = yearCounts[year];
+        const barH = maxCount > 0 ? Math.max(2, (count / maxCount) * chartHeight) : 2;
+        const x = barGap + i * (barWidth + barGap);
+        const y = topPadding + chartHeight - barH;
+        const isSelected = hasSelection && creationYearFilter === parseInt(year);
+        const barClass = isSelected ? 'creation-chart-bar creation-chart-bar-selected' : 'creation-chart-bar';
+        const labelColor = isSelected ? '#a00000' : '#475569';
+        const labelWeight = isSelected ? '700' : 'normal';
+        const tooltipText = `${year}: ${count} ${count === 1 ? 'repository' : 'repositories'} — click to ${isSelected ? 'clear filter' : 'filter by this year'}`;
+        return `<g class="creation-chart-bar-group" onclick="setCreationYearFilter(${year})" role="button" tabindex="0" aria-label="Filter by ${year}: ${count} ${count === 1 ? 'repository' : 'repositories'}">
+            <rect class="${barClass}" x="${x}" y="${y}" width="${barWidth}" height="${barH}" rx="3">
+                <title>${tooltipText}</title>
+            </rect>
+            <text x="${x + barWidth / 2}" y="${y - 5}" text-anchor="middle" font-size="11" fill="#0f172a" font-weight="600" pointer-events="none">${count}</text>
+            <text x="${x + barWidth / 2}" y="${topPadding + chartHeight + 16}" text-anchor="middle" font-size="11" fill="${labelColor}" font-weight="${labelWeight}" pointer-events="none">${year}</text>
+        </g>`;
+    }).join('');
+
+    const svgClass = hasSelection ? 'creation-chart-has-selection' : '';
+    const svg = `<svg class="${svgClass}" width="${svgWidth}" height="${svgHeight}" viewBox="0 0 ${svgWidth} ${svgHeight}" role="img" aria-label="Bar chart of new repositories created per year">
+        <title>New repositories created per year</title>
+        <line x1="0" y1="${topPadding + chartHeight}" x2="${svgWidth}" y2="${topPadding + chartHeight}" stroke="#e2e8f0" stroke-width="1"/>
+        ${bars}
+    </svg>`;
+
+    document.getElementById('creationChartSvg').innerHTML = svg;
+
+    // Update filter label
+    const label = document.getElementById('creationYearFilterLabel');
+    if (hasSelection) {
+        document.getElementById('creationYearFilterValue').textContent = creationYearFilter;
+        label.style.display = 'inline';
+    } else {
+        label.style.display = 'none';
+    }
+}
@@ -5,17 +5,50 @@ Generate an HTML page listing all repositories in the OWASP GitHub organization.
 
 import base64
 import concurrent.futures
+import gzip
+import hashlib
+import html
+import http.client
+import io
 import json
 import os
+import random
 import re
+import ssl
 import sys
+import threading
 import time
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from pathlib import Path
+from string import Template
+from typing import Any, Callable, Iterator, List, Dict, Optional, Tuple
+import urllib.parse
 import urllib.request
 import urllib.error
 
 
+# Front matter keys surfaced on the page. Matching is case-insensitive and
+# tolerates indentation, like the original line-by-line scan.
+_FRONTMATTER_KEY_RE = re.compile(
+    r'^\s*(title|tags|level|pitch|type|region|country)\s*:(.*)$', re.MULTILINE | re.IGNORECASE
+)
+
+
+def _parse_tags(value: str) -> List[str]:
+    """Parse an inline ``tag1, tag2`` or ``[tag1, tag2]`` tag list."""
+    if value.startswith('[') and value.endswith(']'):
+        value = value[1:-1]
+    return [t.strip().strip('"\'') for t in value.split(',') if t.strip()]
+
+
+# Keys whose values need converting; everything else is kept as a string.
+# A converter raising ValueError leaves the previous value in place.
+_FRONTMATTER_PARSERS = {
+    "tags": _parse_tags,
+    "level": float,
+}
+
+
 def parse_yaml_frontmatter(content: str) -> Dict:
     """Parse YAML front matter from markdown content."""
     result = {
@@ -32,12 +65,11 @@ def parse_yaml_frontmatter(content: str) -> Dict:
     if not content.strip().startswith('---'):
         return result
     
-    # Find the closing ---
-    lines = content.split('\n')
+    # Collect the lines between the opening and closing ---
     in_frontmatter = False
     frontmatter_lines = []
     
-    for line in lines:
+    for line in content.splitlines():
         if line.strip() == '---':
             if not in_frontmatter:
                 in_frontmatter = True
@@ -47,62 +79,513 @@ def parse_yaml_frontmatter(content: str) -> Dict:
         if in_frontmatter:
             frontmatter_lines.append(line)
     
-    frontmatter_text = '\n'.join(frontmatter_lines)
-    
     # Parse key-value pairs (simple YAML parsing without external library)
-    for line in frontmatter_lines:
-        if ':' in line:
-            key, _, value = line.partition(':')
-            key = key.strip().lower()
-            value = value.strip()
-            
-            if key == 'title':
-                result['title'] = value
-            elif key == 'tags':
-                # Handle both inline tags and list format
-                if value:
-                    # Handle [tag1, tag2] format
-                    if value.startswith('[') and value.endswith(']'):
-                        value = value[1:-1]
-                    result['tags'] = [t.strip().strip('"\'') for t in value.split(',') if t.strip()]
-            elif key == 'level':
-                try:
-                    result['level'] = float(value)
-                except (ValueError, TypeError):
-                    pass
-            elif key == 'pitch':
-                result['pitch'] = value
-            elif key == 'type':
-                result['type'] = value
-            elif key == 'region':
-                result['region'] = value
-            elif key == 'country':
-                result['country'] = value
+    for match in _FRONTMATTER_KEY_RE.finditer('\n'.join(frontmatter_lines)):
+        key = match.group(1).lower()
+        value = match.group(2).strip()
+        
+        parser = _FRONTMATTER_PARSERS.get(key)
+        if parser is None:
+            result[key] = value
+        elif value:
+            try:
+                result[key] = parser(value)
+            except ValueError:
+                pass
     
     return result
 
 
-def fetch_index_md(owner: str, repo: str, token: str = None) -> Optional[Dict]:
-    """Fetch and parse index.md from a repository."""
-    url = f"https://api.github.com/repos/{owner}/{repo}/contents/index.md"
+# Caps the number of GitHub API requests in flight at once across all worker
+# threads, so a wide thread pool does not trip GitHub's secondary rate limits.
+# Resized from MAX_CONCURRENT_REQUESTS in main().
+_request_limit = 8
+_request_slots = threading.BoundedSemaphore(_request_limit)
+
+
+# Search API calls are additionally limited to a few in flight at a time,
+# which keeps bursts of them clear of the secondary (concurrency) limits.
+# It does not pace them: the 30 requests/minute search quota is enforced by
+# the rate-limit reserve in _send(), which holds search requests until the
+# "search" bucket resets once it runs low.
+_search_slots = threading.BoundedSemaphore(5)
+
+
+def set_request_concurrency(limit: int) -> None:
+    """Set how many GitHub API requests may be in flight at the same time."""
+    global _request_limit, _request_slots
+    _request_limit = max(1, limit)
+    _request_slots = threading.BoundedSemaphore(_request_limit)
+
+
+# Conditional-request cache: URL -> {"etag", "last_modified", "link", "raw"}.
+# "raw" is the response body as JSON text; every hit parses it afresh, which
+# hands the caller its own copy far faster than copy.deepcopy() would.
+# Loaded from CACHE_DIR in main() and written back once the run finishes, so
+# unchanged endpoints come back as 304 Not Modified (no body, and no cost
+# against the authenticated rate limit).
+_response_cache: Dict[str, Dict] = {}
+_cache_used = set()
+_cache_lock = threading.Lock()
+# Conditional requests sent and how many of them came back 304, reported
+# once the run finishes so the cache's effectiveness is visible in the logs
+_cache_stats = {"conditional": 0, "not_modified": 0}
+
+
+def load_cache(cache_dir: str) -> None:
+    """Load cached GitHub API responses from *cache_dir*, if present."""
+    path = Path(cache_dir).expanduser() / "github.json"
+    try:
+        entries = json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring unreadable cache {path}: {e}", file=sys.stderr)
+        return
     
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "OWASP-Bumper-Repo-List-Generator"
-    }
+    for entry in entries.values():
+        # Caches written before bodies were kept as text
+        if "body" in entry:
+            entry["raw"] = json.dumps(entry.pop("body"), separators=(",", ":"))
+    
+    with _cache_lock:
+        _response_cache.clear()
+        _response_cache.update(entries)
+        _cache_used.clear()
+
+
+def save_cache(cache_dir: str) -> None:
+    """Write the responses used during this run back to *cache_dir*.
+    
+    Entries that were not requested this run (renamed or deleted
+    repositories) are dropped so the cache does not grow without bound.
+    """
+    path = Path(cache_dir).expanduser() / "github.json"
+    with _cache_lock:
+        entries = {url: _response_cache[url] for url in _cache_used if url in _response_cache}
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(entries, separators=(",", ":")), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def run_fingerprint(org: str, output_file: str, data_file: str, stylesheet_file: str,
+                    fetch_sparklines: bool, fetch_metadata: bool) -> str:
+    """Identify everything, other than GitHub data, that shapes the page.
+    
+    Covers the generator itself, its stylesheet and script, and the run
+    options. The ISO week is included so the page is fully regenerated at
+    least once a week, refreshing the sparkline windows even when no
+    repository changed.
+    """
+    year, week, _ = datetime.now().isocalendar()
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(PAGE_CSS.encode())
+    digest.update(PAGE_JS.encode())
+    digest.update(f"{org}|{output_file}|{data_file}|{stylesheet_file}|{fetch_sparklines}|{fetch_metadata}|{year}-W{week}".encode())
+    return digest.hexdigest()
+
+
+def load_last_run(cache_dir: str) -> Optional[str]:
+    """Return the fingerprint recorded by the last complete run, if any."""
+    path = Path(cache_dir).expanduser() / "last_run.json"
+    try:
+        return json.loads(path.read_bytes()).get("fingerprint")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def save_last_run(cache_dir: str, fingerprint: str) -> None:
+    """Record *fingerprint* as the inputs of a successfully generated page."""
+    path = Path(cache_dir).expanduser() / "last_run.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"fingerprint": fingerprint}), encoding="utf-8")
+
+
+# Per-repository results of the last run: full_name -> {"pushed_at", "week",
+# "sparkline"} plus "index_md", "open_prs_count" and "last_commit" when
+# metadata was fetched. A repository whose pushed_at is unchanged has no new
+# commits, so its stored results can be reused instead of re-fetched.
+_repo_store: Dict[str, Dict] = {}
+_repo_store_lock = threading.Lock()
+
+
+def _participation_week() -> int:
+    """Return the index of the current participation-stats week.
+    
+    GitHub's weekly buckets start on Sunday (UTC); the Unix epoch fell on a
+    Thursday, four days after the preceding Sunday.
+    """
+    return (int(time.time()) // 86400 + 4) // 7
+
+
+def load_repo_store(cache_dir: str) -> None:
+    """Load the per-repository results saved by the last run, if present."""
+    path = Path(cache_dir).expanduser() / "repos.json"
+    try:
+        records = json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring unreadable repository store {path}: {e}", file=sys.stderr)
+        return
+    
+    with _repo_store_lock:
+        _repo_store.clear()
+        _repo_store.update(records)
+
+
+def save_repo_store(cache_dir: str, repos: List[Dict], with_metadata: bool) -> None:
+    """Record this run's per-repository results in *cache_dir*.
+    
+    Metadata is only stored when it was actually fetched, so a run with
+    FETCH_METADATA=false, or an archived repository skipped this run, does
+    not leave empty records behind for later runs.
+    """
+    week = _participation_week()
+    records = {}
+    for repo in repos:
+        if not repo.get("full_name") or not repo.get("pushed_at"):
+            continue
+        record = {
+            "pushed_at": repo["pushed_at"],
+            "week": week,
+            "sparkline": repo.get("sparkline") or [],
+        }
+        if with_metadata and "index_md" in repo:
+            record["index_md"] = repo.get("index_md") or {}
+            record["open_prs_count"] = repo.get("open_prs_count", 0)
+            record["last_commit"] = repo.get("last_commit") or {}
+        records[repo["full_name"]] = record
+    
+    path = Path(cache_dir).expanduser() / "repos.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(records, separators=(",", ":")), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _stored_record(repo: Dict) -> Optional[Dict]:
+    """Return last run's record for *repo* if it has not been pushed to since."""
+    pushed_at = repo.get("pushed_at")
+    with _repo_store_lock:
+        record = _repo_store.get(repo.get("full_name", ""))
+    if not record or not pushed_at or record.get("pushed_at") != pushed_at:
+        return None
+    return record
+
+
+def _stored_sparkline(record: Dict) -> Optional[List[int]]:
+    """Return the stored sparkline moved forward to the current week.
     
+    With no push since it was stored, every week that has started since
+    then is known to be empty, so the window just shifts left by that many
+    zero weeks.
+    """
+    sparkline = record.get("sparkline")
+    shift = _participation_week() - record.get("week", 0)
+    if not sparkline or shift < 0:
+        return None
+    return (sparkline + [0] * shift)[shift:]
+
+
+# Pagination targets in a GitHub Link header
+_LAST_PAGE_RE = re.compile(r'page=(\d+)>;\s*rel="last"')
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "OWASP-Bumper-Repo-List-Generator"
+}
+
+
+def _api_headers(token: str = None) -> Dict[str, str]:
+    """Return a fresh copy of the headers shared by every GitHub API call.
+    
+    Callers add per-request headers (conditional or content-type) to the
+    copy, so the module-level defaults are never mutated.
+    """
     if token:
-        headers["Authorization"] = f"token {token}"
+        return {**_HEADERS, "Authorization": f"token {token}"}
+    return dict(_HEADERS)
+
+
+MAX_ATTEMPTS = 5
+# Longest single wait accepted from Retry-After / X-RateLimit-Reset before
+# giving up, so an exhausted hourly quota fails the run instead of hanging it.
+MAX_RETRY_WAIT = 15 * 60
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Return how long to wait before retrying after *error*, or ``None``.
+    
+    Rate-limit responses (403/429) honour ``Retry-After`` and
+    ``X-RateLimit-Reset``; server errors and network failures back off
+    exponentially with jitter. Anything else is not retried.
+    """
+    if isinstance(error, urllib.error.HTTPError):
+        if error.code in (403, 429):
+            retry_after = error.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+            reset = error.headers.get("X-RateLimit-Reset")
+            if error.headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+                return max(0.0, int(reset) - time.time()) + 1
+            if error.code == 403:
+                # A plain 403 means access is denied, not throttled.
+                return None
+        elif error.code < 500:
+            return None
+    elif not isinstance(error, (urllib.error.URLError, OSError, http.client.HTTPException)):
+        return None
+    return min(2 ** attempt, 60) + random.random()
+
+
+# Idle keep-alive connections by host. urlopen() opens a new TCP and TLS
+# connection for every request; reusing them saves a handshake per call.
+# At most one connection per request slot is ever busy, so the pool never
+# holds more connections than MAX_CONCURRENT_REQUESTS.
+_idle_connections: Dict[str, List[http.client.HTTPSConnection]] = {}
+_connections_lock = threading.Lock()
+# One TLS context for every connection; HTTPSConnection otherwise builds a
+# new one each time, loading the CA certificates again for every handshake.
+_ssl_context = ssl.create_default_context()
+_MAX_REDIRECTS = 5
+# Connections are only pooled for direct access; with a proxy configured
+# requests go through urlopen(), which knows how to tunnel.
+_USE_PROXY = bool(urllib.request.getproxies().get("https"))
+
+
+def _exchange(host: str, method: str, path: str, body: Optional[bytes],
+              headers: Dict[str, str], timeout: Optional[float]) -> Tuple[http.client.HTTPResponse, bytes]:
+    """Send one request to *host* over a pooled connection and read the reply."""
+    while True:
+        with _connections_lock:
+            idle = _idle_connections.get(host)
+            conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = http.client.HTTPSConnection(host, timeout=timeout, context=_ssl_context)
+        else:
+            conn.timeout = timeout
+            if conn.sock:
+                conn.sock.settimeout(timeout)
+        
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if reused:
+                # The server closed the idle connection; retry on a fresh one.
+                continue
+            raise
+        
+        if response.will_close:
+            conn.close()
+        else:
+            with _connections_lock:
+                _idle_connections.setdefault(host, []).append(conn)
+        return response, data
+
+
+def _open(req: urllib.request.Request, timeout: Optional[float]) -> Tuple[int, Any, bytes]:
+    """Perform *req* like ``urlopen()``, but over a keep-alive connection.
+    
+    Follows redirects (GitHub redirects renamed repositories) and raises
+    ``urllib.error.HTTPError`` for ``304`` and error statuses, exactly as
+    ``urlopen()`` does, so callers cannot tell the two apart.
+    """
+    if _USE_PROXY:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.status, response.headers, response.read()
+    
+    url, method, body = req.full_url, req.get_method(), req.data
+    headers = dict(req.header_items())
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        response, data = _exchange(parts.netloc, method, path, body, headers, timeout)
+        
+        location = response.headers.get("Location")
+        if response.status in (301, 302, 303, 307, 308) and location:
+            url = urllib.parse.urljoin(url, location)
+            if response.status == 303:
+                method, body = "GET", None
+            continue
+        if response.status >= 300:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(data))
+        return response.status, response.headers, data
+    
+    raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, io.BytesIO(data))
+
+
+# Once a rate-limit bucket is down to its last few calls, requests against
+# it wait for the reset instead of spending them and failing with 403/429.
+RATE_LIMIT_RESERVE = 5
+_rate_limit_resume: Dict[str, float] = {}
+_rate_limit_lock = threading.Lock()
+
+
+def _rate_limit_resource(url: str) -> str:
+    """Return the GitHub rate-limit bucket (``X-RateLimit-Resource``) *url* counts against."""
+    path = urllib.parse.urlsplit(url).path
+    if path.startswith("/search/"):
+        return "search"
+    if path == "/graphql":
+        return "graphql"
+    return "core"
+
+
+def _note_rate_limit(headers: Any) -> None:
+    """Record when to resume a bucket whose remaining quota is below the reserve."""
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if not (remaining and remaining.isdigit() and reset and reset.isdigit()):
+        return
+    if int(remaining) < RATE_LIMIT_RESERVE:
+        resource = headers.get("X-RateLimit-Resource") or "core"
+        with _rate_limit_lock:
+            _rate_limit_resume[resource] = max(_rate_limit_resume.get(resource, 0), int(reset) + 1)
+
+
+def _wait_for_rate_limit(url: str) -> None:
+    """Sleep until the bucket *url* counts against has reset, if it is nearly empty.
+    
+    Waits longer than ``MAX_RETRY_WAIT`` are skipped; the request then goes
+    out and fails the same way it would have without the reserve.
+    """
+    with _rate_limit_lock:
+        resume = _rate_limit_resume.get(_rate_limit_resource(url), 0)
+    delay = resume - time.time()
+    if 0 < delay <= MAX_RETRY_WAIT:
+        print(f"  Rate limit nearly exhausted, waiting {delay:.0f}s for reset", file=sys.stderr)
+        time.sleep(delay)
+
+
+def _send(req: urllib.request.Request, timeout: Optional[float]) -> Tuple[int, Any, bytes]:
+    """Send *req* and return ``(status, headers, body)``, retrying transient failures.
+    
+    The request slot is released while waiting so that a throttled request
+    does not block others. Gives up after ``MAX_ATTEMPTS`` tries.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        _wait_for_rate_limit(req.full_url)
+        try:
+            with _request_slots:
+                status, headers, body = _open(req, timeout)
+            _note_rate_limit(headers)
+            return status, headers, body
+        except Exception as e:
+            if isinstance(e, urllib.error.HTTPError) and e.headers is not None:
+                _note_rate_limit(e.headers)
+            delay = _retry_delay(e, attempt)
+            if delay is None or delay > MAX_RETRY_WAIT or attempt == MAX_ATTEMPTS - 1:
+                raise
+            print(f"  Retrying {req.full_url} in {delay:.0f}s ({e})", file=sys.stderr)
+            time.sleep(delay)
+
+
+def fetch_json(url: str, token: str = None, timeout: Optional[float] = 10) -> Tuple[int, Any, Any]:
+    """Issue a GET request against the GitHub API and decode the JSON body.
+    
+    Returns a ``(status, headers, data)`` tuple where *data* is ``None`` for
+    empty bodies (e.g. ``202 Accepted`` from the stats endpoints). Responses
+    carrying an ETag or Last-Modified header are cached, and later requests
+    for the same URL are made conditional; a ``304`` returns a copy of the
+    cached body, so callers may modify what they get back. Other HTTP errors
+    propagate as ``urllib.error.HTTPError`` so each caller decides how to
+    degrade.
+    """
+    headers = _api_headers(token)
+    with _cache_lock:
+        cached = _response_cache.get(url)
+        _cache_used.add(url)
+    if cached and (cached.get("etag") or cached.get("last_modified")):
+        # Both validators are sent when known, so a response that drops the
+        # ETag can still be answered with a 304 from Last-Modified
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        with _cache_lock:
+            _cache_stats["conditional"] += 1
     
     req = urllib.request.Request(url, headers=headers)
     
     try:
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            content_b64 = data.get("content", "")
-            if content_b64:
-                content = base64.b64decode(content_b64).decode('utf-8', errors='replace')
-                return parse_yaml_frontmatter(content)
+        status, resp_headers, body = _send(req, timeout)
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not cached:
+            raise
+        with _cache_lock:
+            _cache_stats["not_modified"] += 1
+        # Not modified: serve the stored body, restoring the Link header
+        # callers use for pagination counts if the 304 omitted it.
+        resp_headers = e.headers
+        if cached.get("link") and not resp_headers.get("Link"):
+            resp_headers["Link"] = cached["link"]
+        return 304, resp_headers, json.loads(cached["raw"])
+    
+    data = json.loads(body) if body else None
+    
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if status == 200 and data is not None and (etag or last_modified):
+        with _cache_lock:
+            _response_cache[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "link": resp_headers.get("Link"),
+                "raw": body.decode("utf-8"),
+            }
+    
+    return status, resp_headers, data
+
+
+def cached_body(url: str) -> Any:
+    """Return the cached response body for *url* without a request, or ``None``.
+    
+    Only safe for content-addressed URLs (such as git blobs by SHA), whose
+    response can never change.
+    """
+    with _cache_lock:
+        cached = _response_cache.get(url)
+        if cached:
+            _cache_used.add(url)
+    return json.loads(cached["raw"]) if cached else None
+
+
+def fetch_index_md(owner: str, repo: str, token: str = None) -> Optional[Dict]:
+    """Fetch and parse index.md from a repository.
+    
+    The root directory listing is checked first, so repositories without an
+    index.md cost one cacheable request instead of an uncacheable 404. The
+    file itself is read as a git blob by SHA, which the response cache can
+    serve without any request once seen.
+    """
+    url = f"https://api.github.com/repos/{owner}/{repo}/contents/"
+    
+    try:
+        _, _, listing = fetch_json(url, token)
+        entry = next(
+            (item for item in listing or [] if item.get("name") == "index.md" and item.get("type") == "file"),
+            None,
+        )
+        if not entry or not entry.get("git_url"):
+            return None
+        
+        data = cached_body(entry["git_url"])
+        if data is None:
+            _, _, data = fetch_json(entry["git_url"], token)
+        content_b64 = (data or {}).get("content", "")
+        if content_b64:
+            content = base64.b64decode(content_b64).decode('utf-8', errors='replace')
+            return parse_yaml_frontmatter(content)
     except urllib.error.HTTPError:
         return None
     except Exception:
@@ -111,68 +594,45 @@ def fetch_index_md(owner: str, repo: str, token: str = None) -> Optional[Dict]:
     return None
 
 
-def fetch_open_prs_count(owner: str, repo: str, token: str = None) -> int:
-    """Fetch the count of open pull requests for a repository."""
-    url = f"https://api.github.com/repos/{owner}/{repo}/pulls?state=open&per_page=1"
-    
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "OWASP-Bumper-Repo-List-Generator"
-    }
-    
-    if token:
-        headers["Authorization"] = f"token {token}"
+def fetch_open_prs_count(owner: str, repo: str, token: str = None) -> Optional[int]:
+    """Fetch the count of open pull requests for a repository.
     
-    req = urllib.request.Request(url, headers=headers)
+    Uses the issue search endpoint, which reports ``total_count`` directly
+    instead of requiring a listing plus Link-header arithmetic. Returns
+    ``None`` when the count could not be fetched (for example a rate-limit
+    403), so a failure is not reported as zero open pull requests.
+    """
+    url = f"https://api.github.com/search/issues?q=repo:{owner}/{repo}+is:pr+is:open&per_page=1"
     
     try:
-        with urllib.request.urlopen(req, timeout=10) as response:
-            # Check the Link header for total count
-            link_header = response.getheader('Link', '')
-            if 'rel="last"' in link_header:
-                # Extract the page number from the last link
-                match = re.search(r'page=(\d+)>; rel="last"', link_header)
-                if match:
-                    return int(match.group(1))
-            # If no Link header, count the items returned
-            data = json.loads(response.read().decode())
-            return len(data)
+        with _search_slots:
+            _, _, data = fetch_json(url, token)
+        return int((data or {}).get("total_count", 0))
     except urllib.error.HTTPError:
-        return 0
+        return None
     except Exception:
-        return 0
+        return None
 
 
 def fetch_last_commit(owner: str, repo: str, token: str = None) -> Optional[Dict]:
     """Fetch the most recent commit for a repository."""
     url = f"https://api.github.com/repos/{owner}/{repo}/commits?per_page=1"
 
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "OWASP-Bumper-Repo-List-Generator"
-    }
-
-    if token:
-        headers["Authorization"] = f"token {token}"
-
-    req = urllib.request.Request(url, headers=headers)
-
     try:
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            if data:
-                commit = data[0]
-                author_obj = commit.get("author") or {}
-                git_author = commit.get("commit", {}).get("author") or {}
-                message = commit.get("commit", {}).get("message", "") or ""
-                # Use only the first line of the commit message
-                message = message.split("\n")[0].strip()
-                return {
-                    "message": message,
-                    "author": author_obj.get("login") or git_author.get("name", ""),
-                    "avatar_url": author_obj.get("avatar_url", ""),
-                    "author_url": author_obj.get("html_url", ""),
-                }
+        _, _, data = fetch_json(url, token)
+        if data:
+            commit = data[0]
+            author_obj = commit.get("author") or {}
+            git_author = commit.get("commit", {}).get("author") or {}
+            message = commit.get("commit", {}).get("message", "") or ""
+            # Use only the first line of the commit message
+            message = message.split("\n")[0].strip()
+            return {
+                "message": message,
+                "author": author_obj.get("login") or git_author.get("name", ""),
+                "avatar_url": author_obj.get("avatar_url", ""),
+                "author_url": author_obj.get("html_url", ""),
+            }
     except urllib.error.HTTPError:
         return None
     except Exception:
@@ -181,76 +641,315 @@ def fetch_last_commit(owner: str, repo: str, token: str = None) -> Optional[Dict
     return None
 
 
-def fetch_participation_stats(owner: str, repo: str, token: str = None) -> Optional[List[int]]:
-    """Fetch weekly commit participation stats for a repository (last 52 weeks)."""
-    url = f"https://api.github.com/repos/{owner}/{repo}/stats/participation"
+# Upper bound on commit pages (100 commits each) read to rebuild a sparkline
+# when the participation stats are not ready yet.
+MAX_ACTIVITY_PAGES = 10
+
+
+def fetch_commit_activity(owner: str, repo: str, token: str = None) -> Optional[List[int]]:
+    """Count a repository's commits per week over the last 52 weeks.
     
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "OWASP-Bumper-Repo-List-Generator"
-    }
+    Builds the same shape as the participation stats (Sunday-based UTC weeks,
+    the current week last) from the commit listing, which never answers
+    ``202``. Returns ``None`` rather than an undercount when the window holds
+    more than ``MAX_ACTIVITY_PAGES`` pages of commits.
+    """
+    current_week = _participation_week()
+    window_start = ((current_week - 51) * 7 - 4) * 86400
+    since = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(window_start))
+    url = f"https://api.github.com/repos/{owner}/{repo}/commits?since={since}&per_page=100"
+    weeks = [0] * 52
     
-    if token:
-        headers["Authorization"] = f"token {token}"
+    try:
+        for _ in range(MAX_ACTIVITY_PAGES):
+            _, headers, data = fetch_json(url, token)
+            for commit in data or []:
+                date = ((commit.get("commit") or {}).get("committer") or {}).get("date") or ""
+                try:
+                    day = int(datetime.fromisoformat(date.replace('Z', '+00:00')).timestamp()) // 86400
+                except ValueError:
+                    continue
+                index = 51 - (current_week - (day + 4) // 7)
+                if 0 <= index < 52:
+                    weeks[index] += 1
+            match = _NEXT_LINK_RE.search(headers.get("Link", ""))
+            if not match:
+                return weeks
+            url = match.group(1)
+    except Exception:
+        return None
     
-    req = urllib.request.Request(url, headers=headers)
+    return None
+
+
+def fetch_participation_stats(owner: str, repo: str, token: str = None) -> Optional[List[int]]:
+    """Fetch weekly commit participation stats for a repository (last 52 weeks).
+    
+    GitHub computes these stats in the background and answers ``202`` until
+    they are ready, which is common on a repository's first run. The weeks
+    are then counted from the commit listing instead.
+    """
+    url = f"https://api.github.com/repos/{owner}/{repo}/stats/participation"
     
     try:
-        with urllib.request.urlopen(req, timeout=10) as response:
-            if response.status == 202:
-                # Stats are being computed, return None
-                return None
-            data = json.loads(response.read().decode())
-            # Return the 'all' array which contains commit counts for all contributors
-            return data.get("all", [])
-    except urllib.error.HTTPError as e:
-        if e.code == 202:
+        status, _, data = fetch_json(url, token)
+        if status == 202 or data is None:
             # Stats are being computed
-            return None
+            return fetch_commit_activity(owner, repo, token)
+        # Return the 'all' array which contains commit counts for all contributors
+        return data.get("all", [])
+    except urllib.error.HTTPError:
         return None
     except Exception:
         return None
 
 
+def _fetch_repos_page(org: str, token: str, page: int, per_page: int) -> Tuple[int, Any, List[Dict]]:
+    """Fetch one page of an organization's repository listing.
+    
+    Returns ``(status, headers, repos)``; status is ``304`` when the page is
+    unchanged since the cached copy. Exits the script on HTTP errors, since
+    a partial listing would silently drop repositories from the generated page.
+    """
+    url = f"https://api.github.com/orgs/{org}/repos?per_page={per_page}&page={page}&sort=updated&direction=desc"
+    
+    try:
+        status, headers, data = fetch_json(url, token, timeout=None)
+    except urllib.error.HTTPError as e:
+        print(f"Error fetching repositories: {e}", file=sys.stderr)
+        print(f"Response: {e.read().decode()}", file=sys.stderr)
+        sys.exit(1)
+    
+    return status, headers, data or []
+
+
+def _fetch_repos_listing(org: str, token: str = None) -> Tuple[List[Dict], bool]:
+    """Fetch all repositories for *org* through the REST listing.
+    
+    Returns ``(repos, unchanged)`` where *unchanged* is true when every
+    listing page came back ``304 Not Modified``. The first page's
+    ``Link: rel="last"`` header gives the page count, so the remaining
+    pages are requested concurrently instead of one by one.
+    """
+    per_page = 100
+    status, headers, repos = _fetch_repos_page(org, token, 1, per_page)
+    unchanged = status == 304
+    
+    last_page = 1
+    match = _LAST_PAGE_RE.search(headers.get('Link', ''))
+    if match:
+        last_page = int(match.group(1))
+    
+    if last_page > 1:
+        pages = range(2, last_page + 1)
+        # More threads than request slots would only queue on the semaphore
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(_request_limit, len(pages))) as executor:
+            # map() yields results in page order, keeping the updated-desc sort
+            for status, _, data in executor.map(lambda page: _fetch_repos_page(org, token, page, per_page), pages):
+                unchanged = unchanged and status == 304
+                repos.extend(data)
+    
+    return repos, unchanged
+
+
 def fetch_repos(org: str, token: str = None) -> List[Dict]:
     """Fetch all repositories for a GitHub organization."""
-    repos = []
-    page = 1
-    per_page = 100
+    return _fetch_repos_listing(org, token)[0]
+
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# The index.md front matter and latest commit, read by both the listing
+# query and the batched metadata query.
+_REPO_METADATA_FRAGMENT = """
+fragment RepoMetadata on Repository {
+  object(expression: "HEAD:index.md") {
+    ... on Blob { text }
+  }
+  defaultBranchRef {
+    target {
+      ... on Commit {
+        history(first: 1) {
+          nodes {
+            messageHeadline
+            author { name user { login avatarUrl url } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# One page of an organization's repositories with everything the page needs
+# except the participation stats, which are only exposed by the REST API.
+# The index.md blob and the latest commit are skipped via @include when
+# metadata fetching is disabled.
+REPOS_GRAPHQL_QUERY = """
+query($org: String!, $cursor: String, $withMetadata: Boolean!) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        name
+        nameWithOwner
+        description
+        url
+        stargazerCount
+        forkCount
+        issues(states: OPEN) { totalCount }
+        pullRequests(states: OPEN) { totalCount }
+        updatedAt
+        createdAt
+        pushedAt
+        primaryLanguage { name }
+        isArchived
+        owner { login }
+        ...RepoMetadata @include(if: $withMetadata)
+      }
+    }
+  }
+}
+""" + _REPO_METADATA_FRAGMENT
+
+# Repositories per aliased query in fetch_metadata_graphql()
+METADATA_BATCH_SIZE = 50
+
+
+def post_graphql(query: str, variables: Dict, token: str, timeout: Optional[float] = 30) -> Dict:
+    """Run a GitHub GraphQL query and return its ``data`` object.
     
-    while True:
-        url = f"https://api.github.com/orgs/{org}/repos?per_page={per_page}&page={page}&sort=updated&direction=desc"
-        
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "OWASP-Bumper-Repo-List-Generator"
+    GraphQL always requires authentication. Raises ``RuntimeError`` when the
+    response carries no data; partial errors are reported as warnings.
+    """
+    headers = _api_headers(token)
+    headers["Content-Type"] = "application/json"
+    payload = json.dumps({"query": query, "variables": variables}).encode()
+    req = urllib.request.Request(GRAPHQL_URL, data=payload, headers=headers, method="POST")
+    
+    _, _, body = _send(req, timeout)
+    result = json.loads(body)
+    
+    errors = result.get("errors")
+    if not result.get("data"):
+        raise RuntimeError(f"GraphQL query failed: {errors}")
+    if errors:
+        print(f"Warning: GraphQL returned partial errors: {errors}", file=sys.stderr)
+    return result["data"]
+
+
+def _metadata_from_graphql(node: Dict) -> Dict:
+    """Extract ``index_md`` and ``last_commit`` from a node carrying the RepoMetadata fields."""
+    text = (node.get("object") or {}).get("text")
+    metadata = {"index_md": parse_yaml_frontmatter(text) if text else {}, "last_commit": {}}
+    
+    target = (node.get("defaultBranchRef") or {}).get("target") or {}
+    commits = (target.get("history") or {}).get("nodes") or []
+    if commits:
+        author = commits[0].get("author") or {}
+        user = author.get("user") or {}
+        metadata["last_commit"] = {
+            "message": (commits[0].get("messageHeadline") or "").strip(),
+            "author": user.get("login") or author.get("name", ""),
+            "avatar_url": user.get("avatarUrl", ""),
+            "author_url": user.get("url", ""),
         }
-        
-        if token:
-            headers["Authorization"] = f"token {token}"
-        
-        req = urllib.request.Request(url, headers=headers)
-        
-        try:
-            with urllib.request.urlopen(req) as response:
-                data = json.loads(response.read().decode())
-                
-                if not data:
-                    break
-                
-                repos.extend(data)
-                page += 1
-                
-                # Check if we've reached the last page
-                if len(data) < per_page:
-                    break
-                    
-        except urllib.error.HTTPError as e:
-            print(f"Error fetching repositories: {e}", file=sys.stderr)
-            print(f"Response: {e.read().decode()}", file=sys.stderr)
-            sys.exit(1)
-    
-    return repos
+    return metadata
+
+
+def _repo_from_graphql(node: Dict, with_metadata: bool) -> Dict:
+    """Convert a GraphQL repository node to the REST shape used downstream."""
+    open_prs = (node.get("pullRequests") or {}).get("totalCount", 0)
+    open_issues = (node.get("issues") or {}).get("totalCount", 0)
+    repo = {
+        "name": node.get("name", ""),
+        "full_name": node.get("nameWithOwner", ""),
+        "description": node.get("description"),
+        "html_url": node.get("url", ""),
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        # The REST API counts open pull requests as issues; keep that meaning.
+        "open_issues_count": open_issues + open_prs,
+        "open_prs_count": open_prs,
+        "updated_at": node.get("updatedAt", ""),
+        "created_at": node.get("createdAt", ""),
+        "pushed_at": node.get("pushedAt", ""),
+        "language": (node.get("primaryLanguage") or {}).get("name"),
+        "archived": node.get("isArchived", False),
+        "owner": {"login": (node.get("owner") or {}).get("login", "")},
+    }
+    
+    if with_metadata:
+        repo.update(_metadata_from_graphql(node))
+    
+    return repo
+
+
+def iter_repos_graphql(org: str, token: str, with_metadata: bool = True) -> Iterator[List[Dict]]:
+    """Yield an organization's repositories through the GraphQL API, a page at a time.
+    
+    Each page of 100 repositories also carries the open PR count and, when
+    *with_metadata* is set, the index.md front matter and the latest commit,
+    replacing three REST calls per repository with one call per 100. Pages
+    are yielded as they arrive, so callers can start on them while the next
+    one is still being fetched.
+    """
+    cursor = None
+    
+    while True:
+        data = post_graphql(
+            REPOS_GRAPHQL_QUERY,
+            {"org": org, "cursor": cursor, "withMetadata": with_metadata},
+            token,
+        )
+        organization = data.get("organization")
+        if not organization:
+            raise RuntimeError(f"Organization not found: {org}")
+        
+        page = organization["repositories"]
+        yield [_repo_from_graphql(node, with_metadata) for node in page["nodes"] if node]
+        
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+
+
+def fetch_metadata_graphql(repos: List[Dict], org: str, token: str) -> Dict[str, Dict]:
+    """Fetch the PR count, index.md and latest commit of *repos* in one GraphQL query.
+    
+    For repositories listed through the REST API. Each repository is an
+    aliased ``repository()`` field, so one round trip replaces three REST
+    calls per repository. Returns ``open_prs_count``, ``index_md`` and
+    ``last_commit`` keyed by repository name; repositories GraphQL could not
+    resolve are left out.
+    """
+    fields = "\n".join(
+        f"  r{i}: repository(owner: {json.dumps(repo.get('owner', {}).get('login', org))}, "
+        f"name: {json.dumps(repo['name'])}) {{ pullRequests(states: OPEN) {{ totalCount }} ...RepoMetadata }}"
+        for i, repo in enumerate(repos)
+    )
+    data = post_graphql(f"query {{\n{fields}\n}}\n{_REPO_METADATA_FRAGMENT}", {}, token)
+    
+    metadata = {}
+    for i, repo in enumerate(repos):
+        node = data.get(f"r{i}")
+        if node:
+            metadata[repo["name"]] = {
+                "open_prs_count": (node.get("pullRequests") or {}).get("totalCount", 0),
+                **_metadata_from_graphql(node),
+            }
+    return metadata
+
+
+def _timestamp(date_str: str) -> int:
+    """Convert an ISO date string to Unix seconds, or 0 when missing or invalid."""
+    if not date_str:
+        return 0
+    try:
+        return int(datetime.fromisoformat(date_str.replace('Z', '+00:00')).timestamp())
+    except ValueError:
+        return 0
+
 
 def format_date(date_str: str) -> str:
     """Format ISO date string to a readable format."""
@@ -259,887 +958,34 @@ def format_date(date_str: str) -> str:
     try:
         dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
         return dt.strftime('%Y-%m-%d')
-    except:
+    except ValueError:
         return date_str
 
-def generate_html(repos: List[Dict], org: str) -> str:
-    """Generate HTML page with repository listing."""
-    
-    # Prepare repository data as JSON for JavaScript
-    repo_data = []
-    for repo in repos:
-        index_md = repo.get("index_md", {}) or {}
-        sparkline = repo.get("sparkline", [])
-        activity_score = sum(sparkline) if sparkline else 0
-        repo_data.append({
-            "name": repo.get("name", ""),
-            "full_name": repo.get("full_name", ""),
-            "description": repo.get("description", "") or "",
-            "html_url": repo.get("html_url", ""),
-            "stargazers_count": repo.get("stargazers_count", 0),
-            "forks_count": repo.get("forks_count", 0),
-            "open_issues_count": repo.get("open_issues_count", 0),
-            "open_prs_count": repo.get("open_prs_count", 0),
-            "updated_at": repo.get("updated_at", ""),
-            "created_at": repo.get("created_at", ""),
-            "language": repo.get("language", "") or "N/A",
-            "archived": repo.get("archived", False),
-            "is_project": "www-project" in repo.get("name", "").lower(),
-            "is_chapter": "www-chapter" in repo.get("name", "").lower(),
-            "sparkline": sparkline,
-            "activity_score": activity_score,
-            # last commit data
-            **{
-                "last_commit_message": (lc := repo.get("last_commit") or {}).get("message", ""),
-                "last_commit_author": lc.get("author", ""),
-                "last_commit_avatar_url": lc.get("avatar_url", ""),
-                "last_commit_author_url": lc.get("author_url", ""),
-            },
-            # index.md data
-            "title": index_md.get("title", ""),
-            "tags": index_md.get("tags", []),
-            "level": index_md.get("level"),
-            "pitch": index_md.get("pitch", ""),
-            "type": index_md.get("type", ""),
-            "region": index_md.get("region", ""),
-            "country": index_md.get("country", "")
-        })
-    
-    html = f"""<!DOCTYPE html>
+
+# Page stylesheet, read once at import. It lives outside the HTML template
+# so its braces need no f-string escaping.
+PAGE_CSS = (Path(__file__).resolve().parent / "assets" / "repo_list.css").read_text(encoding="utf-8")
+
+# Page script, read once at import like the stylesheet. Together with the
+# string.Template page shell below, no part of the page needs brace doubling.
+PAGE_JS = (Path(__file__).resolve().parent / "assets" / "repo_list.js").read_text(encoding="utf-8")
+
+# Page markup around the stylesheet, data and script, filled in by
+# _html_parts(). Only $placeholders are substituted; braces are literal.
+PAGE_HEAD_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{org} GitHub Repositories</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        html {{
-            overflow-x: hidden;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', sans-serif;
-            line-height: 1.6;
-            color: #0f172a;
-            background: #f8fafc;
-            padding: 20px;
-            overflow-x: hidden;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        
-        h1 {{
-            color: #0f172a;
-            margin-bottom: 10px;
-            font-size: 2.5em;
-        }}
-        
-        .subtitle {{
-            color: #475569;
-            margin-bottom: 30px;
-            font-size: 1.1em;
-        }}
-        
-        .controls {{
-            display: flex;
-            gap: 15px;
-            margin-bottom: 25px;
-            flex-wrap: wrap;
-            align-items: center;
-        }}
-        
-        .search-box {{
-            flex: 1;
-            min-width: 250px;
-        }}
-        
-        input[type="text"] {{
-            width: 100%;
-            padding: 12px 15px;
-            border: 2px solid #e2e8f0;
-            border-radius: 6px;
-            font-size: 14px;
-            transition: border-color 0.3s;
-        }}
-        
-        input[type="text"]:focus {{
-            outline: none;
-            border-color: #E10101;
-        }}
-        
-        .btn-group {{
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-        }}
-        
-        button {{
-            padding: 12px 20px;
-            border: 2px solid #E10101;
-            background: white;
-            color: #E10101;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 14px;
-            font-weight: 600;
-            transition: all 0.3s;
-        }}
-        
-        button:hover {{
-            background: #E10101;
-            color: white;
-        }}
-        
-        button.active {{
-            background: #E10101;
-            color: white;
-        }}
-        
-        .checkbox-label {{
-            display: flex;
-            align-items: center;
-            gap: 6px;
-            padding: 12px 20px;
-            font-size: 14px;
-            font-weight: 600;
-            color: #E10101;
-            cursor: pointer;
-            user-select: none;
-        }}
-        
-        .checkbox-label input[type="checkbox"] {{
-            width: 16px;
-            height: 16px;
-            cursor: pointer;
-        }}
-        
-        .sort-buttons {{
-            display: flex;
-            gap: 6px;
-            flex-wrap: wrap;
-            margin-bottom: 15px;
-        }}
-        
-        .sort-btn {{
-            padding: 6px 12px;
-            border: 1px solid #e2e8f0;
-            background: white;
-            color: #475569;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 12px;
-            font-weight: 500;
-            transition: all 0.3s;
-        }}
-        
-        .sort-btn:hover {{
-            border-color: #E10101;
-            color: #E10101;
-        }}
-        
-        .sort-btn.active {{
-            background: #E10101;
-            color: white;
-            border-color: #E10101;
-        }}
-        
-        .stats {{
-            display: flex;
-            gap: 20px;
-            margin-bottom: 20px;
-            flex-wrap: wrap;
-        }}
-        
-        .stat {{
-            padding: 10px 20px;
-            background: #ecf0f1;
-            border-radius: 6px;
-            font-size: 14px;
-        }}
-        
-        .stat strong {{
-            color: #0f172a;
-            font-size: 18px;
-        }}
-        
-        .stat.clickable {{
-            cursor: pointer;
-            transition: all 0.3s;
-        }}
-        
-        .stat.clickable:hover {{
-            background: #d5dbdb;
-        }}
-        
-        .stat.clickable.active {{
-            background: #E10101;
-            color: white;
-        }}
-        
-        .stat.clickable.active strong {{
-            color: white;
-        }}
-        
-        .stat.active-within-year {{
-            border-left: 4px solid #27ae60;
-        }}
-        
-        .stat.inactive-1yr {{
-            border-left: 4px solid #e65100;
-        }}
-        
-        .stat.inactive-3yr {{
-            border-left: 4px solid #bf360c;
-        }}
-        
-        .repo-list {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(380px, 1fr));
-            gap: 12px;
-        }}
-        
-        .repo-item {{
-            padding: 12px 14px;
-            border: 1px solid #e1e8ed;
-            border-radius: 6px;
-            transition: all 0.3s;
-            background: white;
-            display: flex;
-            flex-direction: column;
-        }}
-        
-        .repo-item:hover {{
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            transform: translateY(-1px);
-        }}
-        
-        .repo-item.archived {{
-            opacity: 0.7;
-            background: #f9f9f9;
-        }}
-        
-        .repo-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: flex-start;
-            margin-bottom: 6px;
-            gap: 8px;
-        }}
-        
-        .repo-name {{
-            flex: 1;
-            min-width: 0;
-        }}
-        
-        .repo-name a {{
-            color: #E10101;
-            text-decoration: none;
-            font-size: 14px;
-            font-weight: 600;
-            word-break: break-word;
-            display: block;
-        }}
-        
-        .repo-name a:hover {{
-            text-decoration: underline;
-        }}
-        
-        .repo-title {{
-            font-size: 11px;
-            color: #666;
-            margin-top: 2px;
-            white-space: nowrap;
-            overflow: hidden;
-            text-overflow: ellipsis;
-        }}
-        
-        .repo-badges {{
-            display: flex;
-            gap: 4px;
-            flex-wrap: wrap;
-            align-items: center;
-            flex-shrink: 0;
-        }}
-        
-        .badge {{
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-size: 9px;
-            font-weight: 600;
-            text-transform: uppercase;
-            white-space: nowrap;
-        }}
-        
-        .badge.project {{
-            background: #e8f5e9;
-            color: #2e7d32;
-        }}
-        
-        .badge.chapter {{
-            background: #fee2e2;
-            color: #dc2626;
-        }}
-        
-        .badge.archived {{
-            background: #ffebee;
-            color: #c62828;
-        }}
-        
-        .badge.language {{
-            background: #f8fafc;
-            color: #475569;
-        }}
-        
-        .badge.inactive-1yr {{
-            background: #fff3e0;
-            color: #e65100;
-        }}
-        
-        .badge.inactive-3yr {{
-            background: #ffccbc;
-            color: #bf360c;
-        }}
-        
-        .badge.level {{
-            background: #9c27b0;
-            color: white;
-        }}
-        
-        .badge.level-1 {{
-            background: #e1bee7;
-            color: #6a1b9a;
-        }}
-        
-        .badge.level-2 {{
-            background: #ce93d8;
-            color: #4a148c;
-        }}
-        
-        .badge.level-3 {{
-            background: #ab47bc;
-            color: white;
-        }}
-        
-        .badge.level-4 {{
-            background: #7b1fa2;
-            color: white;
-        }}
-        
-        .badge.tag {{
-            background: #e0e0e0;
-            color: #424242;
-            font-size: 8px;
-        }}
-        
-        .bump-btn {{
-            padding: 4px 8px;
-            background: #ff9800;
-            color: white;
-            border: none;
-            border-radius: 3px;
-            font-size: 10px;
-            font-weight: 600;
-            cursor: pointer;
-            text-decoration: none;
-            display: inline-flex;
-            align-items: center;
-            gap: 3px;
-            transition: background 0.3s;
-        }}
-        
-        .bump-btn:hover {{
-            background: #f57c00;
-        }}
-        
-        .bump-btn.archived {{
-            background: #bdbdbd;
-            cursor: not-allowed;
-        }}
-        
-        .repo-description {{
-            color: #666;
-            margin-bottom: 6px;
-            line-height: 1.4;
-            font-size: 12px;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-            flex-grow: 1;
-        }}
-        
-        .repo-pitch {{
-            color: #555;
-            font-size: 11px;
-            font-style: italic;
-            margin-bottom: 6px;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-            padding: 4px 6px;
-            background: #f8fafc;
-            border-radius: 3px;
-            border-left: 2px solid #E10101;
-        }}
-        
-        .repo-tags {{
-            display: flex;
-            gap: 3px;
-            flex-wrap: wrap;
-            margin-bottom: 6px;
-        }}
-        
-        .repo-meta {{
-            display: flex;
-            gap: 8px;
-            font-size: 11px;
-            color: #475569;
-            flex-wrap: nowrap;
-            overflow-x: auto;
-        }}
-        
-        .meta-item {{
-            display: flex;
-            align-items: center;
-            gap: 3px;
-            white-space: nowrap;
-            flex-shrink: 0;
-        }}
-        
-        .meta-item.prs {{
-            color: #9c27b0;
-        }}
-        
-        .sparkline-container {{
-            display: flex;
-            align-items: center;
-            gap: 6px;
-            margin-top: 6px;
-            padding-top: 6px;
-            border-top: 1px solid #f0f0f0;
-            flex-wrap: nowrap;
-            overflow-x: auto;
-        }}
-        
-        .sparkline-label {{
-            font-size: 10px;
-            color: #475569;
-            white-space: nowrap;
-            flex-shrink: 0;
-        }}
-        
-        .sparkline {{
-            stroke: #E10101;
-            fill: none;
-            stroke-width: 1.5;
-        }}
-        
-        .sparkline-fill {{
-            fill: rgba(225, 1, 1, 0.1);
-            stroke: none;
-        }}
-        
-        .repo-item.archived .sparkline {{
-            stroke: #cbd5e1;
-        }}
-        
-        .repo-item.archived .sparkline-fill {{
-            fill: rgba(203, 213, 225, 0.1);
-        }}
-        
-        .activity-score {{
-            font-size: 12px;
-            font-weight: 600;
-            color: #E10101;
-            background: #fee2e2;
-            padding: 2px 8px;
-            border-radius: 4px;
-            white-space: nowrap;
-            flex-shrink: 0;
-        }}
-        
-        .repo-item.archived .activity-score {{
-            color: #475569;
-            background: #f8fafc;
-        }}
-        
-        .last-commit {{
-            display: flex;
-            align-items: center;
-            gap: 6px;
-            margin-top: 6px;
-            padding-top: 6px;
-            border-top: 1px solid #f0f0f0;
-            font-size: 11px;
-            color: #475569;
-            overflow: hidden;
-        }}
-        
-        .last-commit-avatar {{
-            width: 18px;
-            height: 18px;
-            border-radius: 50%;
-            flex-shrink: 0;
-            vertical-align: middle;
-        }}
-        
-        .last-commit-author {{
-            font-weight: 600;
-            white-space: nowrap;
-            flex-shrink: 0;
-            color: #0f172a;
-            text-decoration: none;
-        }}
-        
-        .last-commit-author:hover {{
-            text-decoration: underline;
-        }}
-        
-        .last-commit-message {{
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-            color: #475569;
-        }}
-        
-        .last-commit-cell {{
-            display: flex;
-            align-items: center;
-            gap: 4px;
-            min-width: 160px;
-            max-width: 240px;
-        }}
-        
-        .last-commit-cell-text {{
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-            font-size: 11px;
-        }}
-        
-        .no-results {{
-            text-align: center;
-            padding: 60px 20px;
-            color: #475569;
-            font-size: 18px;
-            grid-column: 1 / -1;
-        }}
-        
-        .loading {{
-            text-align: center;
-            padding: 40px;
-            color: #E10101;
-        }}
-        
-        .table-wrapper {{
-            overflow-x: auto;
-            width: 100%;
-        }}
-        
-        table.repo-table {{
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 13px;
-        }}
-        
-        table.repo-table th {{
-            background: #f8fafc;
-            padding: 10px 12px;
-            text-align: left;
-            font-weight: 600;
-            color: #0f172a;
-            border-bottom: 2px solid #e2e8f0;
-            white-space: nowrap;
-            position: sticky;
-            top: 0;
-            z-index: 1;
-        }}
-        
-        table.repo-table th.sortable {{
-            cursor: pointer;
-            user-select: none;
-        }}
-        
-        table.repo-table th.sortable:hover {{
-            background: #fee2e2;
-            color: #E10101;
-        }}
-        
-        table.repo-table th.sort-active {{
-            background: #fee2e2;
-            color: #E10101;
-        }}
-        
-        table.repo-table td {{
-            padding: 8px 12px;
-            border-bottom: 1px solid #f0f0f0;
-            vertical-align: middle;
-        }}
-        
-        table.repo-table tbody tr:hover td {{
-            background: #fef2f2;
-        }}
-        
-        table.repo-table tbody tr.archived td {{
-            opacity: 0.7;
-            background: #f9f9f9;
-        }}
-        
-        table.repo-table tbody tr.archived:hover td {{
-            background: #f5f5f5;
-        }}
-        
-        .table-name-link {{
-            color: #E10101;
-            text-decoration: none;
-            font-weight: 600;
-        }}
-        
-        .table-name-link:hover {{
-            text-decoration: underline;
-        }}
-        
-        .table-desc {{
-            max-width: 280px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-            color: #666;
-            font-size: 12px;
-        }}
-        
-        .table-num {{
-            text-align: right;
-            font-variant-numeric: tabular-nums;
-        }}
-        
-        .sort-arrow {{
-            margin-left: 4px;
-            font-size: 10px;
-            opacity: 0.6;
-        }}
-        
-        .creation-chart-section {{
-            margin-bottom: 30px;
-            padding: 20px;
-            background: #f8fafc;
-            border-radius: 8px;
-            border: 1px solid #e2e8f0;
-        }}
-        
-        .creation-chart-title {{
-            font-size: 16px;
-            font-weight: 600;
-            color: #0f172a;
-            margin-bottom: 15px;
-        }}
-        
-        .creation-chart-wrapper {{
-            overflow-x: auto;
-            width: 100%;
-        }}
-        
-        .creation-chart-bar {{
-            fill: #E10101;
-            opacity: 0.85;
-            transition: opacity 0.2s, fill 0.2s;
-            cursor: pointer;
-        }}
-        
-        .creation-chart-bar:hover {{
-            opacity: 1;
-        }}
-        
-        .creation-chart-bar-selected {{
-            fill: #a00000;
-            opacity: 1;
-        }}
-        
-        .creation-chart-has-selection .creation-chart-bar:not(.creation-chart-bar-selected) {{
-            opacity: 0.35;
-        }}
-        
-        .creation-chart-bar-group {{
-            cursor: pointer;
-        }}
-        
-        .year-filter-clear-btn {{
-            background: none;
-            border: 1px solid #E10101;
-            color: #E10101;
-            border-radius: 4px;
-            padding: 1px 6px;
-            font-size: 11px;
-            cursor: pointer;
-            margin-left: 4px;
-            vertical-align: middle;
-        }}
-        
-        .year-filter-clear-btn:hover {{
-            background: #E10101;
-            color: #fff;
-        }}
-        
-        footer {{
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #e2e8f0;
-            text-align: center;
-            color: #475569;
-            font-size: 14px;
-        }}
-        
-        @media (max-width: 768px) {{
-            body {{
-                padding: 10px;
-                width: 100%;
-                max-width: 100vw;
-            }}
-            
-            .container {{
-                padding: 12px;
-                max-width: 100%;
-                width: calc(100% - 20px);
-                margin: 0 auto;
-                overflow-x: hidden;
-                box-sizing: border-box;
-            }}
-            
-            h1 {{
-                font-size: 1.8em;
-            }}
-            
-            .controls {{
-                flex-direction: column;
-            }}
-            
-            .search-box {{
-                width: 100%;
-            }}
-            
-            .btn-group {{
-                width: 100%;
-            }}
-            
-            button {{
-                flex: 1;
-            }}
-            
-            .sort-buttons {{
-                justify-content: flex-start;
-                flex-wrap: wrap;
-            }}
-            
-            .sort-btn {{
-                padding: 5px 10px;
-                font-size: 11px;
-            }}
-            
-            .repo-list {{
-                display: flex;
-                flex-direction: column;
-                gap: 12px;
-            }}
-            
-            .repo-item {{
-                width: 100%;
-                max-width: calc(100vw - 44px);
-                padding: 12px;
-                box-sizing: border-box;
-                overflow: hidden;
-                margin: 0;
-            }}
-            
-            .repo-header {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-            
-            .repo-name {{
-                width: 100%;
-                margin-bottom: 8px;
-            }}
-            
-            .repo-badges {{
-                width: 100%;
-                flex-wrap: wrap;
-            }}
-            
-            .repo-description {{
-                word-break: break-word;
-                overflow-wrap: break-word;
-            }}
-            
-            .repo-meta {{
-                flex-direction: row;
-                flex-wrap: nowrap;
-                overflow-x: auto;
-                gap: 8px;
-            }}
-            
-            .meta-item {{
-                display: inline-flex;
-                flex-shrink: 0;
-            }}
-            
-            .sparkline-container {{
-                flex-direction: row;
-                align-items: center;
-                gap: 6px;
-                max-width: 100%;
-                flex-wrap: nowrap;
-                overflow-x: auto;
-            }}
-            
-            .sparkline-svg {{
-                max-width: 100%;
-            }}
-            
-            .stats {{
-                flex-direction: column;
-                gap: 10px;
-            }}
-            
-            .stat {{
-                width: 100%;
-                text-align: center;
-                box-sizing: border-box;
-            }}
-            
-            .repo-badges {{
-                max-width: 100%;
-            }}
-            
-            .badge {{
-                font-size: 10px;
-                padding: 3px 6px;
-            }}
-            
-            .bump-btn {{
-                padding: 4px 8px;
-                font-size: 11px;
-            }}
-        }}
-    </style>
-</head>
+    <title>$org GitHub Repositories</title>
+$preload_link""")
+
+PAGE_BODY_TEMPLATE = Template("""</head>
 <body>
     <div class="container">
         <h1>OWASP Bumper 🚀💪</h1>
         <div class="subtitle">This application aims to help encourage repositories to stay active by giving them a bump of a new issue with one click! 🔔✨</div>
-        <div class="subtitle">Comprehensive listing of all {org} GitHub repositories | <a href="https://github.com/OWASP-BLT/OWASP-Bumper" target="_blank" style="color: #E10101;">View on GitHub</a></div>
+        <div class="subtitle">Comprehensive listing of all $org GitHub repositories | <a href="https://github.com/OWASP-BLT/OWASP-Bumper" target="_blank" style="color: #E10101;">View on GitHub</a></div>
         
         <div class="creation-chart-section">
             <div class="creation-chart-title">📊 New Repositories Created Over Time<span id="creationYearFilterLabel" style="display:none"> — <span id="creationYearFilterValue"></span> <button class="year-filter-clear-btn" onclick="setCreationYearFilter(null)">✕ Clear</button></span></div>
@@ -1222,790 +1068,565 @@ def generate_html(repos: List[Dict], org: str) -> str:
         
         <div id="repoList" class="repo-list"></div>
         
+        <template id="repoCardTemplate">
+            <div class="repo-item">
+                <div class="repo-header">
+                    <div class="repo-name">
+                        <a target="_blank" data-bind="name"></a>
+                        <div class="repo-title" data-bind="title"></div>
+                    </div>
+                    <div class="repo-badges" data-bind="badges"></div>
+                </div>
+                <div class="repo-pitch" data-bind="pitch"></div>
+                <div class="repo-description" data-bind="description"></div>
+                <div class="repo-tags" data-bind="tags"></div>
+                <div class="repo-meta">
+                    <span class="meta-item" data-bind="stars"></span>
+                    <span class="meta-item" data-bind="forks"></span>
+                    <span class="meta-item" data-bind="issues"></span>
+                    <span class="meta-item prs" data-bind="prs"></span>
+                    <span class="meta-item" data-bind="updated"></span>
+                </div>
+                <div class="last-commit" data-bind="lastCommit"></div>
+                <div class="sparkline-container">
+                    <span class="sparkline-label">📈 Activity (52 weeks):</span>
+                    <span data-bind="sparkline"></span>
+                    <span class="activity-score" title="Total commits in the last 52 weeks" data-bind="score"></span>
+                </div>
+            </div>
+        </template>
+        
+        <template id="repoRowTemplate">
+            <tr>
+                <td><a target="_blank" class="table-name-link" data-bind="name"></a><div class="repo-title" data-bind="title"></div></td>
+                <td><div style="display:flex;gap:3px;flex-wrap:wrap" data-bind="badges"></div></td>
+                <td><div class="table-desc" data-bind="description"></div></td>
+                <td><div style="display:flex;gap:3px;flex-wrap:wrap" data-bind="tags"></div></td>
+                <td data-bind="language"></td>
+                <td data-bind="level"></td>
+                <td class="table-num" data-bind="stars"></td>
+                <td class="table-num" data-bind="forks"></td>
+                <td class="table-num" data-bind="issues"></td>
+                <td class="table-num" data-bind="prs"></td>
+                <td style="white-space:nowrap"><span data-bind="sparkline"></span> <span style="font-size:11px;font-weight:600;color:#E10101" data-bind="score"></span></td>
+                <td style="white-space:nowrap;font-size:12px" data-bind="updated"></td>
+                <td style="white-space:nowrap;font-size:12px" data-bind="created"></td>
+                <td data-bind="lastCommit"></td>
+                <td data-bind="bump"></td>
+            </tr>
+        </template>
+        
         <footer>
-            Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC | Total: {len(repos)} repositories
+            Generated on $generated UTC | Total: $count repositories
         </footer>
     </div>
     
-    <script>
-        const repos = {json.dumps(repo_data, indent=8)};
-        
-        let currentFilter = 'all';
-        let currentSort = 'activity-desc';
-        let searchTerm = '';
-        let activityFilter = 'all';
-        let hideArchived = true;
-        let viewMode = 'cards';
-        let creationYearFilter = null;
-        
-        // HTML escape function to prevent XSS
-        function escapeHtml(text) {{
-            if (!text) return '';
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }}
-        
-        function formatDate(dateStr) {{
-            if (!dateStr) return 'N/A';
-            const date = new Date(dateStr);
-            return date.toLocaleDateString('en-US', {{ year: 'numeric', month: 'short', day: 'numeric' }});
-        }}
-        
-        function getTimeAgo(dateStr) {{
-            if (!dateStr) return '';
-            const date = new Date(dateStr);
-            const now = new Date();
-            const diffMs = now - date;
-            const diffSeconds = Math.floor(diffMs / 1000);
-            const diffMinutes = Math.floor(diffSeconds / 60);
-            const diffHours = Math.floor(diffMinutes / 60);
-            const diffDays = Math.floor(diffHours / 24);
-            const diffWeeks = Math.floor(diffDays / 7);
-            const diffMonths = Math.floor(diffDays / 30);
-            const diffYears = Math.floor(diffDays / 365);
-            
-            if (diffYears > 0) {{
-                return diffYears === 1 ? '1 year ago' : `${{diffYears}} years ago`;
-            }} else if (diffMonths > 0) {{
-                return diffMonths === 1 ? '1 month ago' : `${{diffMonths}} months ago`;
-            }} else if (diffWeeks > 0) {{
-                return diffWeeks === 1 ? '1 week ago' : `${{diffWeeks}} weeks ago`;
-            }} else if (diffDays > 0) {{
-                return diffDays === 1 ? '1 day ago' : `${{diffDays}} days ago`;
-            }} else if (diffHours > 0) {{
-                return diffHours === 1 ? '1 hour ago' : `${{diffHours}} hours ago`;
-            }} else if (diffMinutes > 0) {{
-                return diffMinutes === 1 ? '1 minute ago' : `${{diffMinutes}} minutes ago`;
-            }} else {{
-                return 'just now';
-            }}
-        }}
-        
-        function getYearsSinceUpdate(dateStr) {{
-            if (!dateStr) return 0;
-            const lastUpdate = new Date(dateStr);
-            const now = new Date();
-            const diffTime = now - lastUpdate;
-            const diffYears = diffTime / (1000 * 60 * 60 * 24 * 365.25);
-            return diffYears;
-        }}
-        
-        function generateSparklineSVG(data, width = 100, height = 20) {{
-            if (!data || data.length === 0) {{
-                return '<span class="sparkline-label" style="color: #bdc3c7;">No activity data</span>';
-            }}
-            
-            const max = Math.max(...data, 1);
-            const divisor = data.length > 1 ? data.length - 1 : 1;
-            
-            // Helper to calculate coordinates
-            const getCoord = (value, index) => {{
-                const x = (index / divisor) * width;
-                const y = height - (value / max) * height;
-                return `${{x.toFixed(1)}},${{y.toFixed(1)}}`;
-            }};
-            
-            const points = data.map((value, index) => getCoord(value, index)).join(' ');
-            
-            // Create fill path (area under the line)
-            const fillPoints = data.map((value, index) => getCoord(value, index));
-            const fillPath = `M0,${{height}} L${{fillPoints.join(' L')}} L${{width}},${{height}} Z`;
-            
-            const totalCommits = data.reduce((a, b) => a + b, 0);
-            const title = `${{totalCommits}} commits in the last 52 weeks`;
-            
-            return `<svg class="sparkline-svg" width="${{width}}" height="${{height}}" viewBox="0 0 ${{width}} ${{height}}" title="${{title}}">
-                <title>${{title}}</title>
-                <path class="sparkline-fill" d="${{fillPath}}"></path>
-                <polyline class="sparkline" points="${{points}}"></polyline>
-            </svg>`;
-        }}
-        
-        function getBumpIssueUrl(repo) {{
-            const title = encodeURIComponent('Repository Activity Reminder');
-            const body = encodeURIComponent(
-`Hello from the OWASP BLT team! 👋
+    """)
 
-We noticed that this repository hasn't seen much activity recently. We wanted to reach out to check on the status of this project.
 
-**Please consider one of the following actions:**
-- ✅ If this project is still active, please update it with any recent changes or a simple commit to show it's maintained
-- 📦 If this project is no longer maintained, please consider archiving it to help keep the OWASP organization tidy
-- 💬 If you need help or resources, please let us know in the comments
+def _script_json(data: Any) -> str:
+    """Serialize data compactly for embedding in an inline <script> block."""
+    # "</" is escaped so a description containing "</script>" cannot end the block.
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
 
-Thank you for contributing to the OWASP community!
 
----
-*This issue was created via the [OWASP Bumper](https://github.com/OWASP-BLT/OWASP-Bumper) tool to help keep track of repository activity.*`
-            );
-            return `${{repo.html_url}}/issues/new?title=${{title}}&body=${{body}}`;
-        }}
-        
-        function setFilter(filter) {{
-            currentFilter = filter;
-            
-            // Update button states
-            document.querySelectorAll('.btn-group button').forEach(btn => btn.classList.remove('active'));
-            document.getElementById('filter' + filter.charAt(0).toUpperCase() + filter.slice(1)).classList.add('active');
-            
-            renderRepos();
-        }}
-        
-        function setActivityFilter(filter) {{
-            // Toggle filter - if clicking the same one, clear it
-            if (activityFilter === filter) {{
-                activityFilter = 'all';
-            }} else {{
-                activityFilter = filter;
-            }}
-            
-            // Update button states
-            document.querySelectorAll('.stat.clickable').forEach(stat => stat.classList.remove('active'));
-            if (activityFilter !== 'all') {{
-                if (activityFilter === 'within-year') {{
-                    document.getElementById('filterActiveYear').classList.add('active');
-                }} else if (activityFilter === '1yr-old') {{
-                    document.getElementById('filterInactive1yr').classList.add('active');
-                }} else if (activityFilter === '3yr-old') {{
-                    document.getElementById('filterInactive3yr').classList.add('active');
-                }}
-            }}
-            
-            renderRepos();
-        }}
-        
-        function setCreationYearFilter(year) {{
-            // Toggle filter - if clicking the same year or passing null, clear it
-            if (year === null || creationYearFilter === year) {{
-                creationYearFilter = null;
-            }} else {{
-                creationYearFilter = year;
-            }}
-            renderCreationChart();
-            renderRepos();
-        }}
-        
-        function toggleHideArchived() {{
-            hideArchived = document.getElementById('hideArchived').checked;
-            renderRepos();
-        }}
-        
-        function setViewMode(mode) {{
-            viewMode = mode;
-            document.getElementById('viewCards').classList.toggle('active', mode === 'cards');
-            document.getElementById('viewTable').classList.toggle('active', mode === 'table');
-            renderRepos();
-        }}
-        
-        function getSortArrow(colKey) {{
-            if (currentSort === colKey + '-desc') return '↓';
-            if (currentSort === colKey + '-asc') return '↑';
-            return '⇅';
-        }}
-        
-        function sortByColumn(colKey) {{
-            if (currentSort === colKey + '-desc') {{
-                currentSort = colKey + '-asc';
-            }} else {{
-                currentSort = colKey + '-desc';
-            }}
-            document.querySelectorAll('.sort-btn').forEach(b => {{
-                b.classList.toggle('active', b.dataset.sort === currentSort);
-            }});
-            renderRepos();
-        }}
-        
-        function sortRepos(repos, sortBy) {{
-            const sorted = [...repos];
-            
-            switch(sortBy) {{
-                case 'updated-desc':
-                    sorted.sort((a, b) => new Date(b.updated_at) - new Date(a.updated_at));
-                    break;
-                case 'updated-asc':
-                    sorted.sort((a, b) => new Date(a.updated_at) - new Date(b.updated_at));
-                    break;
-                case 'created-desc':
-                    sorted.sort((a, b) => new Date(b.created_at) - new Date(a.created_at));
-                    break;
-                case 'created-asc':
-                    sorted.sort((a, b) => new Date(a.created_at) - new Date(b.created_at));
-                    break;
-                case 'name-asc':
-                    sorted.sort((a, b) => a.name.localeCompare(b.name));
-                    break;
-                case 'name-desc':
-                    sorted.sort((a, b) => b.name.localeCompare(a.name));
-                    break;
-                case 'stars-desc':
-                    sorted.sort((a, b) => b.stargazers_count - a.stargazers_count);
-                    break;
-                case 'stars-asc':
-                    sorted.sort((a, b) => a.stargazers_count - b.stargazers_count);
-                    break;
-                case 'forks-desc':
-                    sorted.sort((a, b) => b.forks_count - a.forks_count);
-                    break;
-                case 'forks-asc':
-                    sorted.sort((a, b) => a.forks_count - b.forks_count);
-                    break;
-                case 'activity-desc':
-                    sorted.sort((a, b) => b.activity_score - a.activity_score);
-                    break;
-                case 'activity-asc':
-                    sorted.sort((a, b) => a.activity_score - b.activity_score);
-                    break;
-                case 'prs-desc':
-                    sorted.sort((a, b) => (b.open_prs_count || 0) - (a.open_prs_count || 0));
-                    break;
-                case 'prs-asc':
-                    sorted.sort((a, b) => (a.open_prs_count || 0) - (b.open_prs_count || 0));
-                    break;
-                case 'issues-desc':
-                    sorted.sort((a, b) => b.open_issues_count - a.open_issues_count);
-                    break;
-                case 'issues-asc':
-                    sorted.sort((a, b) => a.open_issues_count - b.open_issues_count);
-                    break;
-                case 'level-desc':
-                    sorted.sort((a, b) => (b.level || 0) - (a.level || 0));
-                    break;
-                case 'level-asc':
-                    sorted.sort((a, b) => (a.level || 0) - (b.level || 0));
-                    break;
-            }}
-            
-            return sorted;
-        }}
-        
-        function filterRepos(repos) {{
-            let filtered = repos;
-            
-            // Apply hide archived filter
-            if (hideArchived) {{
-                filtered = filtered.filter(repo => !repo.archived);
-            }}
-            
-            // Apply filter
-            if (currentFilter === 'project') {{
-                filtered = filtered.filter(repo => repo.is_project);
-            }} else if (currentFilter === 'chapter') {{
-                filtered = filtered.filter(repo => repo.is_chapter);
-            }} else if (currentFilter === 'other') {{
-                filtered = filtered.filter(repo => !repo.is_project && !repo.is_chapter);
-            }}
-            
-            // Apply activity filter
-            if (activityFilter === 'within-year') {{
-                filtered = filtered.filter(repo => getYearsSinceUpdate(repo.updated_at) < 1);
-            }} else if (activityFilter === '1yr-old') {{
-                filtered = filtered.filter(repo => getYearsSinceUpdate(repo.updated_at) >= 1);
-            }} else if (activityFilter === '3yr-old') {{
-                filtered = filtered.filter(repo => getYearsSinceUpdate(repo.updated_at) >= 3);
-            }}
-            
-            // Apply creation year filter
-            if (creationYearFilter !== null) {{
-                filtered = filtered.filter(repo => {{
-                    if (!repo.created_at) return false;
-                    return new Date(repo.created_at).getFullYear() === creationYearFilter;
-                }});
-            }}
-            
-            // Apply search
-            if (searchTerm) {{
-                const term = searchTerm.toLowerCase();
-                filtered = filtered.filter(repo => 
-                    repo.name.toLowerCase().includes(term) || 
-                    repo.description.toLowerCase().includes(term) ||
-                    (repo.title && repo.title.toLowerCase().includes(term)) ||
-                    (repo.pitch && repo.pitch.toLowerCase().includes(term)) ||
-                    (repo.tags && repo.tags.some(tag => tag.toLowerCase().includes(term)))
-                );
-            }}
-            
-            return filtered;
-        }}
-        
-        function renderCards(filtered) {{
-            const container = document.getElementById('repoList');
-            container.className = 'repo-list';
-            
-            if (filtered.length === 0) {{
-                container.innerHTML = '<div class="no-results">No repositories match your criteria</div>';
-                document.getElementById('visibleCount').textContent = '0';
-                return;
-            }}
-            
-            container.innerHTML = filtered.map(repo => {{
-                const badges = [];
-                const yearsSinceUpdate = getYearsSinceUpdate(repo.updated_at);
-                
-                // Level badge
-                if (repo.level !== null && repo.level !== undefined) {{
-                    const levelClass = repo.level >= 4 ? 'level-4' : 
-                                       repo.level >= 3 ? 'level-3' : 
-                                       repo.level >= 2 ? 'level-2' : 'level-1';
-                    badges.push(`<span class="badge level ${{levelClass}}" title="OWASP Level ${{repo.level}}">L${{repo.level}}</span>`);
-                }}
-                
-                if (repo.is_project) {{
-                    badges.push('<span class="badge project">Project</span>');
-                }}
-                if (repo.is_chapter) {{
-                    badges.push('<span class="badge chapter">Chapter</span>');
-                }}
-                if (repo.archived) {{
-                    badges.push('<span class="badge archived">Archived</span>');
-                }}
-                if (repo.language && repo.language !== 'N/A') {{
-                    badges.push(`<span class="badge language">${{repo.language}}</span>`);
-                }}
-                
-                // Add activity indicator badges
-                if (yearsSinceUpdate >= 3) {{
-                    badges.push('<span class="badge inactive-3yr" title="No activity in 3+ years">3yr+</span>');
-                }} else if (yearsSinceUpdate >= 1) {{
-                    badges.push('<span class="badge inactive-1yr" title="No activity in 1+ year">1yr+</span>');
-                }}
-                
-                // Only show bump button for repos not updated in over 1 year (and not archived)
-                let bumpButton = '';
-                if (yearsSinceUpdate >= 1) {{
-                    bumpButton = repo.archived 
-                        ? `<span class="bump-btn archived" title="Cannot bump archived repositories">🔔</span>`
-                        : `<a href="${{getBumpIssueUrl(repo)}}" target="_blank" class="bump-btn" title="Create a reminder issue in this repository">🔔</a>`;
-                }}
-                
-                // Generate sparkline
-                const sparklineHtml = generateSparklineSVG(repo.sparkline, 80, 16);
-                
-                // Display title if different from name (escaped)
-                const escapedTitle = escapeHtml(repo.title);
-                const displayTitle = repo.title && repo.title !== repo.name ? 
-                    `<div class="repo-title" title="${{escapedTitle}}">${{escapedTitle}}</div>` : '';
-                
-                // Display pitch if available (escaped)
-                const escapedPitch = escapeHtml(repo.pitch);
-                const pitchHtml = repo.pitch ? 
-                    `<div class="repo-pitch" title="${{escapedPitch}}">${{escapedPitch}}</div>` : '';
-                
-                // Display tags (escaped)
-                const tagsHtml = repo.tags && repo.tags.length > 0 ?
-                    `<div class="repo-tags">${{repo.tags.slice(0, 5).map(tag => `<span class="badge tag">${{escapeHtml(tag)}}</span>`).join('')}}</div>` : '';
-                
-                // Escape description
-                const escapedDesc = escapeHtml(repo.description) || 'No description';
-                
-                // Last commit section
-                let lastCommitHtml = '';
-                if (repo.last_commit_message || repo.last_commit_author) {{
-                    const avatarHtml = repo.last_commit_avatar_url
-                        ? `<img class="last-commit-avatar" src="${{escapeHtml(repo.last_commit_avatar_url)}}" alt="${{escapeHtml(repo.last_commit_author)}}" loading="lazy">`
-                        : '💬';
-                    const authorHtml = repo.last_commit_author
-                        ? (repo.last_commit_author_url
-                            ? `<a class="last-commit-author" href="${{escapeHtml(repo.last_commit_author_url)}}" target="_blank" rel="noopener noreferrer">${{escapeHtml(repo.last_commit_author)}}</a>`
-                            : `<span class="last-commit-author">${{escapeHtml(repo.last_commit_author)}}</span>`)
-                        : '';
-                    lastCommitHtml = `<div class="last-commit">
-                        ${{avatarHtml}}
-                        ${{authorHtml}}
-                        <span class="last-commit-message" title="${{escapeHtml(repo.last_commit_message)}}">${{escapeHtml(repo.last_commit_message)}}</span>
-                    </div>`;
-                }}
-                
-                return `
-                    <div class="repo-item ${{repo.archived ? 'archived' : ''}}">
-                        <div class="repo-header">
-                            <div class="repo-name">
-                                <a href="${{repo.html_url}}" target="_blank">${{escapeHtml(repo.name)}}</a>
-                                ${{displayTitle}}
-                            </div>
-                            <div class="repo-badges">
-                                ${{badges.join('')}}
-                                ${{bumpButton}}
-                            </div>
-                        </div>
-                        ${{pitchHtml || `<div class="repo-description">${{escapedDesc}}</div>`}}
-                        ${{tagsHtml}}
-                        <div class="repo-meta">
-                            <span class="meta-item">⭐ ${{repo.stargazers_count}}</span>
-                            <span class="meta-item">🔱 ${{repo.forks_count}}</span>
-                            <span class="meta-item">📝 ${{repo.open_issues_count}}</span>
-                            ${{repo.open_prs_count > 0 ? `<span class="meta-item prs">🔀 ${{repo.open_prs_count}} PRs</span>` : ''}}
-                            <span class="meta-item">📅 ${{getTimeAgo(repo.updated_at)}}</span>
-                        </div>
-                        ${{lastCommitHtml}}
-                        <div class="sparkline-container">
-                            <span class="sparkline-label">📈 Activity (52 weeks):</span>
-                            ${{sparklineHtml}}
-                            <span class="activity-score" title="Total commits in the last 52 weeks">Score: ${{repo.activity_score}}</span>
-                        </div>
-                    </div>
-                `;
-            }}).join('');
-            
-            document.getElementById('visibleCount').textContent = filtered.length;
-        }}
-        
-        function renderTable(filtered) {{
-            const container = document.getElementById('repoList');
-            container.className = '';
-            
-            if (filtered.length === 0) {{
-                container.innerHTML = '<div class="no-results">No repositories match your criteria</div>';
-                document.getElementById('visibleCount').textContent = '0';
-                return;
-            }}
-            
-            const columns = [
-                {{ key: 'name',        label: 'Name',        sortKey: 'name' }},
-                {{ key: 'type',        label: 'Type',        sortKey: null }},
-                {{ key: 'description', label: 'Description', sortKey: null }},
-                {{ key: 'tags',        label: 'Tags',        sortKey: null }},
-                {{ key: 'language',    label: 'Language',    sortKey: null }},
-                {{ key: 'level',       label: 'Level',       sortKey: 'level' }},
-                {{ key: 'stars',       label: '⭐ Stars',    sortKey: 'stars' }},
-                {{ key: 'forks',       label: '🔱 Forks',   sortKey: 'forks' }},
-                {{ key: 'issues',      label: '📝 Issues',  sortKey: 'issues' }},
-                {{ key: 'prs',         label: '🔀 PRs',     sortKey: 'prs' }},
-                {{ key: 'activity',    label: '📈 Activity', sortKey: 'activity' }},
-                {{ key: 'updated',     label: '📅 Updated',  sortKey: 'updated' }},
-                {{ key: 'created',     label: '📅 Created',  sortKey: 'created' }},
-                {{ key: 'lastcommit',  label: '💬 Last Commit', sortKey: null }},
-                {{ key: 'bump',        label: 'Bump',        sortKey: null }},
-            ];
-            
-            const thead = columns.map(col => {{
-                if (col.sortKey) {{
-                    const isActive = currentSort.startsWith(col.sortKey + '-');
-                    const arrow = getSortArrow(col.sortKey);
-                    return `<th class="sortable${{isActive ? ' sort-active' : ''}}" onclick="sortByColumn('${{col.sortKey}}')">${{col.label}} <span class="sort-arrow">${{arrow}}</span></th>`;
-                }}
-                return `<th>${{col.label}}</th>`;
-            }}).join('');
-            
-            const rows = filtered.map(repo => {{
-                const yearsSinceUpdate = getYearsSinceUpdate(repo.updated_at);
-                
-                // Type badges
-                const typeBadges = [];
-                if (repo.is_project) typeBadges.push('<span class="badge project">Project</span>');
-                if (repo.is_chapter) typeBadges.push('<span class="badge chapter">Chapter</span>');
-                if (repo.archived) typeBadges.push('<span class="badge archived">Archived</span>');
-                if (yearsSinceUpdate >= 3) typeBadges.push('<span class="badge inactive-3yr" title="No activity in 3+ years">3yr+</span>');
-                else if (yearsSinceUpdate >= 1) typeBadges.push('<span class="badge inactive-1yr" title="No activity in 1+ year">1yr+</span>');
-                
-                // Level badge
-                let levelCell = '';
-                if (repo.level !== null && repo.level !== undefined) {{
-                    const levelClass = repo.level >= 4 ? 'level-4' : repo.level >= 3 ? 'level-3' : repo.level >= 2 ? 'level-2' : 'level-1';
-                    levelCell = `<span class="badge level ${{levelClass}}" title="OWASP Level ${{repo.level}}">L${{repo.level}}</span>`;
-                }}
-                
-                // Language
-                const langCell = repo.language && repo.language !== 'N/A' ? `<span class="badge language">${{escapeHtml(repo.language)}}</span>` : '';
-                
-                // Description (prefer pitch, fall back to description)
-                const descText = repo.pitch || repo.description || 'No description';
-                
-                // Tags (up to 4)
-                const tagsCell = repo.tags && repo.tags.length > 0
-                    ? repo.tags.slice(0, 4).map(t => `<span class="badge tag">${{escapeHtml(t)}}</span>`).join(' ')
-                    : '';
-                
-                // Sparkline
-                const sparklineHtml = generateSparklineSVG(repo.sparkline, 60, 14);
-                
-                // Bump button
-                let bumpButton = '';
-                if (yearsSinceUpdate >= 1) {{
-                    bumpButton = repo.archived
-                        ? `<span class="bump-btn archived" title="Cannot bump archived repositories">🔔</span>`
-                        : `<a href="${{getBumpIssueUrl(repo)}}" target="_blank" class="bump-btn" title="Create a reminder issue in this repository">🔔</a>`;
-                }}
-                
-                // Title (if different from name)
-                const titleHtml = repo.title && repo.title !== repo.name
-                    ? `<div class="repo-title" title="${{escapeHtml(repo.title)}}">${{escapeHtml(repo.title)}}</div>`
-                    : '';
-                
-                // Last commit cell
-                let lastCommitCell = '';
-                if (repo.last_commit_message || repo.last_commit_author) {{
-                    const avatarHtml = repo.last_commit_avatar_url
-                        ? `<img class="last-commit-avatar" src="${{escapeHtml(repo.last_commit_avatar_url)}}" alt="${{escapeHtml(repo.last_commit_author)}}" loading="lazy"> `
-                        : '';
-                    const authorHtml = repo.last_commit_author
-                        ? (repo.last_commit_author_url
-                            ? `<a class="last-commit-author" href="${{escapeHtml(repo.last_commit_author_url)}}" target="_blank" rel="noopener noreferrer">${{escapeHtml(repo.last_commit_author)}}</a>: `
-                            : `<span class="last-commit-author">${{escapeHtml(repo.last_commit_author)}}</span>: `)
-                        : '';
-                    lastCommitCell = `<div class="last-commit-cell">
-                        ${{avatarHtml}}<span class="last-commit-cell-text" title="${{escapeHtml(repo.last_commit_author + (repo.last_commit_message ? ': ' + repo.last_commit_message : ''))}}">${{authorHtml}}${{escapeHtml(repo.last_commit_message)}}</span>
-                    </div>`;
-                }}
-                
-                return `<tr class="${{repo.archived ? 'archived' : ''}}">
-                    <td><a href="${{repo.html_url}}" target="_blank" class="table-name-link">${{escapeHtml(repo.name)}}</a>${{titleHtml}}</td>
-                    <td><div style="display:flex;gap:3px;flex-wrap:wrap">${{typeBadges.join('')}}</div></td>
-                    <td><div class="table-desc" title="${{escapeHtml(descText)}}">${{escapeHtml(descText)}}</div></td>
-                    <td><div style="display:flex;gap:3px;flex-wrap:wrap">${{tagsCell}}</div></td>
-                    <td>${{langCell}}</td>
-                    <td>${{levelCell}}</td>
-                    <td class="table-num">${{repo.stargazers_count}}</td>
-                    <td class="table-num">${{repo.forks_count}}</td>
-                    <td class="table-num">${{repo.open_issues_count}}</td>
-                    <td class="table-num">${{repo.open_prs_count || 0}}</td>
-                    <td style="white-space:nowrap">${{sparklineHtml}} <span style="font-size:11px;font-weight:600;color:#E10101">${{repo.activity_score}}</span></td>
-                    <td style="white-space:nowrap;font-size:12px">${{getTimeAgo(repo.updated_at)}}</td>
-                    <td style="white-space:nowrap;font-size:12px">${{formatDate(repo.created_at)}}</td>
-                    <td>${{lastCommitCell}}</td>
-                    <td>${{bumpButton}}</td>
-                </tr>`;
-            }}).join('');
-            
-            container.innerHTML = `<div class="table-wrapper"><table class="repo-table"><thead><tr>${{thead}}</tr></thead><tbody>${{rows}}</tbody></table></div>`;
-            document.getElementById('visibleCount').textContent = filtered.length;
-        }}
-        
-        function renderRepos() {{
-            const sorted = sortRepos(repos, currentSort);
-            const filtered = filterRepos(sorted);
-            if (viewMode === 'table') {{
-                renderTable(filtered);
-            }} else {{
-                renderCards(filtered);
-            }}
-        }}
-        
-        function updateStats() {{
-            const totalRepos = repos.length;
-            const archivedRepos = repos.filter(r => r.archived).length;
-            const activeRepos = totalRepos - archivedRepos;
-            
-            const totalProjects = repos.filter(r => r.is_project).length;
-            const archivedProjects = repos.filter(r => r.is_project && r.archived).length;
-            const activeProjects = totalProjects - archivedProjects;
-            
-            const totalChapters = repos.filter(r => r.is_chapter).length;
-            const archivedChapters = repos.filter(r => r.is_chapter && r.archived).length;
-            const activeChapters = totalChapters - archivedChapters;
-            
-            // Activity-based counts
-            const activeWithinYear = repos.filter(r => getYearsSinceUpdate(r.updated_at) < 1).length;
-            const olderThan1Year = repos.filter(r => getYearsSinceUpdate(r.updated_at) >= 1).length;
-            const olderThan3Years = repos.filter(r => getYearsSinceUpdate(r.updated_at) >= 3).length;
-            
-            document.getElementById('totalCount').textContent = totalRepos;
-            document.getElementById('visibleCount').textContent = totalRepos;
-            document.getElementById('activeReposCount').textContent = activeRepos;
-            document.getElementById('archivedReposCount').textContent = archivedRepos;
-            
-            document.getElementById('projectCount').textContent = totalProjects;
-            document.getElementById('activeProjectsCount').textContent = activeProjects;
-            document.getElementById('archivedProjectsCount').textContent = archivedProjects;
-            
-            document.getElementById('chapterCount').textContent = totalChapters;
-            document.getElementById('activeChaptersCount').textContent = activeChapters;
-            document.getElementById('archivedChaptersCount').textContent = archivedChapters;
-            
-            // Update activity-based counts
-            document.getElementById('activeYearCount').textContent = activeWithinYear;
-            document.getElementById('inactive1yrCount').textContent = olderThan1Year;
-            document.getElementById('inactive3yrCount').textContent = olderThan3Years;
-        }}
-        
-        // Event listeners
-        document.getElementById('searchInput').addEventListener('input', (e) => {{
-            searchTerm = e.target.value;
-            renderRepos();
-        }});
-        
-        // Sort button event listeners
-        document.querySelectorAll('.sort-btn').forEach(btn => {{
-            btn.addEventListener('click', (e) => {{
-                document.querySelectorAll('.sort-btn').forEach(b => b.classList.remove('active'));
-                e.target.classList.add('active');
-                currentSort = e.target.dataset.sort;
-                renderRepos();
-            }});
-        }});
-        
-        function renderCreationChart() {{
-            const yearCounts = {{}};
-            repos.forEach(repo => {{
-                if (repo.created_at) {{
-                    const year = new Date(repo.created_at).getFullYear();
-                    yearCounts[year] = (yearCounts[year] || 0) + 1;
-                }}
-            }});
-            
-            const years = Object.keys(yearCounts).sort();
-            if (years.length === 0) return;
-            
-            const counts = years.map(y => yearCounts[y]);
-            const maxCount = Math.max(...counts);
-            
-            const barWidth = 44;
-            const barGap = 10;
-            const chartHeight = 130;
-            const topPadding = 20;
-            const labelHeight = 22;
-            const svgWidth = years.length * (barWidth + barGap) + barGap;
-            const svgHeight = topPadding + chartHeight + labelHeight;
-            
-            const hasSelection = creationYearFilter !== null;
-            
-            const bars = years.map((year, i) => {{
-                const count = yearCounts[year];
-                const barH = maxCount > 0 ? Math.max(2, (count / maxCount) * chartHeight) : 2;
-                const x = barGap + i * (barWidth + barGap);
-                const y = topPadding + chartHeight - barH;
-                const isSelected = hasSelection && creationYearFilter === parseInt(year);
-                const barClass = isSelected ? 'creation-chart-bar creation-chart-bar-selected' : 'creation-chart-bar';
-                const labelColor = isSelected ? '#a00000' : '#475569';
-                const labelWeight = isSelected ? '700' : 'normal';
-                const tooltipText = `${{year}}: ${{count}} ${{count === 1 ? 'repository' : 'repositories'}} — click to ${{isSelected ? 'clear filter' : 'filter by this year'}}`;
-                return `<g class="creation-chart-bar-group" onclick="setCreationYearFilter(${{year}})" role="button" tabindex="0" aria-label="Filter by ${{year}}: ${{count}} ${{count === 1 ? 'repository' : 'repositories'}}">
-                    <rect class="${{barClass}}" x="${{x}}" y="${{y}}" width="${{barWidth}}" height="${{barH}}" rx="3">
-                        <title>${{tooltipText}}</title>
-                    </rect>
-                    <text x="${{x + barWidth / 2}}" y="${{y - 5}}" text-anchor="middle" font-size="11" fill="#0f172a" font-weight="600" pointer-events="none">${{count}}</text>
-                    <text x="${{x + barWidth / 2}}" y="${{topPadding + chartHeight + 16}}" text-anchor="middle" font-size="11" fill="${{labelColor}}" font-weight="${{labelWeight}}" pointer-events="none">${{year}}</text>
-                </g>`;
-            }}).join('');
-            
-            const svgClass = hasSelection ? 'creation-chart-has-selection' : '';
-            const svg = `<svg class="${{svgClass}}" width="${{svgWidth}}" height="${{svgHeight}}" viewBox="0 0 ${{svgWidth}} ${{svgHeight}}" role="img" aria-label="Bar chart of new repositories created per year">
-                <title>New repositories created per year</title>
-                <line x1="0" y1="${{topPadding + chartHeight}}" x2="${{svgWidth}}" y2="${{topPadding + chartHeight}}" stroke="#e2e8f0" stroke-width="1"/>
-                ${{bars}}
-            </svg>`;
-            
-            document.getElementById('creationChartSvg').innerHTML = svg;
-            
-            // Update filter label
-            const label = document.getElementById('creationYearFilterLabel');
-            if (hasSelection) {{
-                document.getElementById('creationYearFilterValue').textContent = creationYearFilter;
-                label.style.display = 'inline';
-            }} else {{
-                label.style.display = 'none';
-            }}
-        }}
-        
-        // Initial render
+def _repo_entry(repo: Dict) -> Dict:
+    """Flatten a fetched repository into the record embedded in the page.
+    
+    Records carry data rather than display strings. The page builds each
+    card and table row once and reuses it, so precomputed badge markup would
+    only grow the payload, and "3 days ago" style dates must be worked out
+    when the page is viewed, not when it was generated.
+    """
+    name = repo.get("name", "")
+    name_lower = name.lower()
+    index_md = repo.get("index_md") or {}
+    last_commit = repo.get("last_commit") or {}
+    sparkline = repo.get("sparkline", [])
+    return {
+        "name": name,
+        "full_name": repo.get("full_name", ""),
+        "description": repo.get("description", "") or "",
+        "html_url": repo.get("html_url", ""),
+        "stargazers_count": repo.get("stargazers_count", 0),
+        "forks_count": repo.get("forks_count", 0),
+        "open_issues_count": repo.get("open_issues_count", 0),
+        # None when the count is unknown, which the page shows as such
+        "open_prs_count": repo.get("open_prs_count"),
+        # The dates as Unix seconds, so the page can sort, compare and display
+        # them without parsing a date string each time
+        "updated_ts": _timestamp(repo.get("updated_at", "")),
+        "created_ts": _timestamp(repo.get("created_at", "")),
+        "language": repo.get("language", "") or "N/A",
+        "archived": repo.get("archived", False),
+        "is_project": "www-project" in name_lower,
+        "is_chapter": "www-chapter" in name_lower,
+        "sparkline": sparkline,
+        # Aggregates are computed once here rather than on every client render
+        "activity_score": sum(sparkline),
+        "sparkline_peak": max(sparkline, default=0),
+        # last commit data
+        "last_commit_message": last_commit.get("message", ""),
+        "last_commit_author": last_commit.get("author", ""),
+        "last_commit_avatar_url": last_commit.get("avatar_url", ""),
+        "last_commit_author_url": last_commit.get("author_url", ""),
+        # index.md data
+        "title": index_md.get("title", ""),
+        "tags": index_md.get("tags", []),
+        "level": index_md.get("level"),
+        "pitch": index_md.get("pitch", ""),
+    }
+
+
+def _repo_columns(repos: List[Dict]) -> Dict[str, List]:
+    """Lay the page's repository records out column by column.
+    
+    Each field name then appears once instead of once per repository, which
+    cuts the payload by about a third; the page's fromColumns() turns the
+    columns back into one object per repository.
+    """
+    entries = [_repo_entry(repo) for repo in repos]
+    fields = entries[0].keys() if entries else _repo_entry({}).keys()
+    return {field: [entry[field] for entry in entries] for field in fields}
+
+
+def _pack_sparklines(sparklines: List[List[int]]) -> str:
+    """Pack every sparkline's weekly counts into one base64 string of LEB128 varints.
+    
+    Almost every week has fewer than 128 commits and takes a single byte,
+    which comes out about a third smaller than the same numbers as JSON.
+    """
+    packed = bytearray()
+    for sparkline in sparklines:
+        for value in sparkline:
+            while value >= 0x80:
+                packed.append(value & 0x7F | 0x80)
+                value >>= 7
+            packed.append(value)
+    return base64.b64encode(bytes(packed)).decode("ascii")
+
+
+# Columns with few distinct values, sent as indexes into a list of those values
+DICTIONARY_COLUMNS = ("language", "last_commit_author", "last_commit_avatar_url", "last_commit_author_url")
+
+
+def _dictionary_encode(values: List[Any]) -> Tuple[List[Any], List[int]]:
+    """Split *values* into its distinct values and each entry's index into them."""
+    distinct: Dict[Any, int] = {}
+    indexes = [distinct.setdefault(value, len(distinct)) for value in values]
+    return list(distinct), indexes
+
+
+def _repo_payload(repos: List[Dict]) -> Dict[str, Any]:
+    """Build the data the page loads: the record columns plus the packed sparklines.
+    
+    The page's loadRepos() rebuilds the records and gives each one its
+    sparkline as a view into a single typed array. The DICTIONARY_COLUMNS
+    name each distinct value once, and the page shares one string per value.
+    """
+    columns = _repo_columns(repos)
+    sparklines = columns.pop("sparkline")
+    columns["sparkline_weeks"] = [len(sparkline) for sparkline in sparklines]
+    dictionaries = {}
+    for field in DICTIONARY_COLUMNS:
+        dictionaries[field], columns[field] = _dictionary_encode(columns[field])
+    return {"columns": columns, "dictionaries": dictionaries, "sparklines": _pack_sparklines(sparklines)}
+
+
+def write_repo_data(repos: List[Dict], path: str) -> None:
+    """Write the page's repository records to *path* as a standalone JSON file."""
+    Path(path).write_text(json.dumps(_repo_payload(repos), separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+
+
+def _html_parts(repos: List[Dict], org: str, data_url: Optional[str] = None,
+                stylesheet_url: Optional[str] = None) -> List[str]:
+    """Build the page as a list of pieces, for generate_html() and write_html().
+    
+    The embedded data is a piece of its own rather than part of a template,
+    so it is never copied into a larger string.
+    """
+    
+    if stylesheet_url is None:
+        style_parts = ["    <style>\n", PAGE_CSS, "    </style>\n"]
+    else:
+        style_parts = [f"""    <link rel="stylesheet" href="{html.escape(stylesheet_url)}">\n"""]
+    preload_link = ""
+    if data_url is None:
+        # Embed the repository data as a JSON block: JSON.parse() is much
+        # faster than having the JS parser evaluate the same data as a literal
+        data_script = ['<script type="application/json" id="repoData">', _script_json(_repo_payload(repos)), "</script>\n    "]
+        repos_script = "const repos = loadRepos(JSON.parse(document.getElementById('repoData').textContent));"
+        init_script = """updateStats();
+renderCreationChart();
+renderRepos();"""
+    else:
+        # Start downloading the data while the page itself is still parsing
+        preload_link = f"""    <link rel="preload" href="{html.escape(data_url)}" as="fetch" crossorigin="anonymous">
+"""
+        data_script = []
+        repos_script = "let repos = [];"
+        init_script = "fetch(" + _script_json(data_url) + """)
+    .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+    })
+    .then(data => {
+        repos = loadRepos(data);
         updateStats();
         renderCreationChart();
         renderRepos();
-    </script>
-</body>
-</html>
-"""
+    })
+    .catch(err => {
+        document.getElementById('repoList').textContent = `Failed to load repository data: ${err.message}`;
+    });"""
+    
+    html_parts = [
+        PAGE_HEAD_TEMPLATE.substitute(org=org, preload_link=preload_link),
+        *style_parts,
+        PAGE_BODY_TEMPLATE.substitute(
+            org=org,
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            count=len(repos),
+        ),
+        *data_script,
+        "<script>\n",
+        repos_script,
+        "\n\n",
+        PAGE_JS,
+        "\n// Initial render\n",
+        init_script,
+        "\n</script>\n</body>\n</html>\n",
+    ]
+    
+    return html_parts
+
+
+def write_gzip_copy(path: str) -> str:
+    """Write a gzip-compressed copy of *path* to ``<path>.gz`` and return its name.
     
-    return html
+    For static hosts that can serve precompressed files (nginx
+    ``gzip_static``, most CDNs), so the compression is done once here at the
+    highest level rather than on the fly per request. The gzip header carries
+    no timestamp, so unchanged output gives an identical file.
+    """
+    gz_path = path + ".gz"
+    Path(gz_path).write_bytes(gzip.compress(Path(path).read_bytes(), compresslevel=9, mtime=0))
+    return gz_path
+
 
-def _fetch_repo_extra_data(repo: Dict, org: str, token: str, fetch_sparklines: bool, fetch_metadata: bool) -> Dict:
-    """Fetch all extra data for a single repository (sparkline + metadata).
+def generate_html(repos: List[Dict], org: str, data_url: Optional[str] = None,
+                  stylesheet_url: Optional[str] = None) -> str:
+    """Generate HTML page with repository listing.
+    
+    By default the repository data is embedded, so the page works on its own
+    (including from ``file://``). With *data_url* the page instead loads the
+    file written by ``write_repo_data()`` from that URL, which keeps the HTML
+    small and lets browsers cache the data separately. Likewise the styles are
+    inlined unless *stylesheet_url* points at a copy of ``PAGE_CSS``.
+    """
+    return "".join(_html_parts(repos, org, data_url, stylesheet_url))
+
+
+def write_html(path: str, repos: List[Dict], org: str, data_url: Optional[str] = None,
+               stylesheet_url: Optional[str] = None) -> None:
+    """Write the page ``generate_html()`` builds straight to *path*, piece by piece.
+    
+    The whole page never exists as one string, which keeps peak memory to
+    roughly the size of the embedded data.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(_html_parts(repos, org, data_url, stylesheet_url))
 
-    Modifies *repo* in-place and also returns it, so it can be used both as a
-    concurrent.futures worker target and for direct calls.
+def _is_dormant(repo: Dict) -> bool:
+    """Return True for archived repositories with no push in the last year.
+    
+    Archived repositories are read-only, and one untouched for a year lies
+    wholly outside the 52-week participation window, so its sparkline is
+    known to be all zeros without asking the stats API.
+    """
+    if not repo.get("archived"):
+        return False
+    try:
+        pushed = datetime.fromisoformat((repo.get("pushed_at") or "").replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    return (datetime.now(pushed.tzinfo) - pushed).days > 366
 
-    Parameters:
-        repo: Repository dict from the GitHub API (modified in place).
-        org: GitHub organisation name, used as fallback owner.
-        token: GitHub API token; pass empty string to skip authenticated calls.
-        fetch_sparklines: Whether to fetch 52-week participation stats.
-        fetch_metadata: Whether to fetch index.md, PR count, and last commit.
 
-    Returns:
-        The same *repo* dict with sparkline/index_md/open_prs_count/last_commit set.
+def _plan_repo_requests(
+    repo: Dict, org: str, token: str, fetch_sparklines: bool, fetch_metadata: bool
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """Fill in what *repo* needs without a request and list the requests left.
+    
+    Fields that can be settled locally (defaults, dormant or unchanged
+    repositories, GraphQL-provided metadata) are set on *repo* directly.
+    Every field that still needs the API is set to its empty default and
+    returned as a ``(field, fetch)`` pair, where ``fetch()`` returns the
+    field's value. The pairs are independent of each other, so they can run
+    concurrently.
     """
     owner = repo.get("owner", {}).get("login", org)
     repo_name = repo.get("name", "")
+    requests = []
 
     if not repo_name:
         repo["sparkline"] = []
         repo["index_md"] = {}
         repo["open_prs_count"] = 0
         repo["last_commit"] = {}
-        return repo
+        return requests
+
+    record = _stored_record(repo)
+    stored_sparkline = _stored_sparkline(record) if record else None
 
+    def fetch_prs() -> Optional[int]:
+        # A failed search keeps the last known count rather than showing 0
+        count = fetch_open_prs_count(owner, repo_name, token)
+        return count if count is not None else (record or {}).get("open_prs_count")
+
+    repo["sparkline"] = []
     if fetch_sparklines and token:
-        sparkline_data = fetch_participation_stats(owner, repo_name, token)
-        repo["sparkline"] = sparkline_data if sparkline_data else []
-    else:
-        repo["sparkline"] = []
+        if _is_dormant(repo):
+            repo["sparkline"] = [0] * 52
+        elif stored_sparkline:
+            repo["sparkline"] = stored_sparkline
+        else:
+            requests.append(("sparkline", lambda: fetch_participation_stats(owner, repo_name, token) or []))
 
     if fetch_metadata and token:
-        repo["index_md"] = fetch_index_md(owner, repo_name, token) or {}
-        repo["open_prs_count"] = fetch_open_prs_count(owner, repo_name, token)
-        repo["last_commit"] = fetch_last_commit(owner, repo_name, token) or {}
+        # Repositories listed through GraphQL, or covered by the batched
+        # metadata query, already carry their metadata. Archived ones take no
+        # new pull requests or commits, so the per-repository REST requests
+        # are skipped for them.
+        if "index_md" not in repo:
+            archived = repo.get("archived", False)
+            if record and "index_md" in record:
+                # No push since the last run: index.md and the latest commit
+                # are unchanged. Pull requests open and close without a push,
+                # so only an archived repository's stored count still holds.
+                repo["index_md"] = record.get("index_md") or {}
+                repo["last_commit"] = record.get("last_commit") or {}
+                if archived:
+                    repo["open_prs_count"] = record.get("open_prs_count", 0)
+                else:
+                    repo["open_prs_count"] = 0
+                    requests.append(("open_prs_count", fetch_prs))
+            elif not archived:
+                repo["index_md"] = {}
+                repo["open_prs_count"] = 0
+                repo["last_commit"] = {}
+                requests.append(("index_md", lambda: fetch_index_md(owner, repo_name, token) or {}))
+                requests.append(("open_prs_count", fetch_prs))
+                requests.append(("last_commit", lambda: fetch_last_commit(owner, repo_name, token) or {}))
+            else:
+                # An archived repository with nothing stored gets no metadata
+                # this run. index_md stays unset, so save_repo_store() does
+                # not record the empty fields for later runs.
+                repo["open_prs_count"] = 0
     else:
         repo["index_md"] = {}
         repo["open_prs_count"] = 0
         repo["last_commit"] = {}
 
-    return repo
+    return requests
+
+
+def _prefetch_metadata(repos: List[Dict], org: str, token: str,
+                       executor: concurrent.futures.Executor) -> None:
+    """Fill in the metadata of REST-listed repositories with batched GraphQL queries.
+    
+    Covers the repositories _plan_repo_requests() would otherwise query over
+    REST, METADATA_BATCH_SIZE at a time. The first batch runs on its own: if
+    it fails, GraphQL is assumed unavailable and every repository keeps its
+    REST requests. A later batch that fails leaves only its own repositories
+    to REST.
+    """
+    # Stored metadata only settles archived repositories; the others are
+    # queried again for their current open PR count.
+    pending = [
+        repo for repo in repos
+        if repo.get("name") and (not repo.get("archived") or "index_md" not in (_stored_record(repo) or {}))
+    ]
+    batches = [pending[i:i + METADATA_BATCH_SIZE] for i in range(0, len(pending), METADATA_BATCH_SIZE)]
+    if not batches:
+        return
+    
+    def apply(batch: List[Dict], metadata: Dict[str, Dict]) -> None:
+        for repo in batch:
+            if repo["name"] in metadata:
+                repo.update(metadata[repo["name"]])
+    
+    try:
+        apply(batches[0], fetch_metadata_graphql(batches[0], org, token))
+    except Exception as exc:
+        print(f"  Warning: batched GraphQL metadata unavailable ({exc}), using the REST API", file=sys.stderr)
+        return
+    
+    futures = {executor.submit(fetch_metadata_graphql, batch, org, token): batch for batch in batches[1:]}
+    for future in concurrent.futures.as_completed(futures):
+        try:
+            apply(futures[future], future.result())
+        except Exception as exc:
+            print(f"  Warning: batched GraphQL metadata failed ({exc}), using the REST API", file=sys.stderr)
+    print(f"  Metadata for {sum('index_md' in repo for repo in pending)}/{len(pending)} repositories fetched in "
+          f"{len(batches)} GraphQL queries")
 
 
 def main():
     org = os.environ.get('GITHUB_ORG', 'owasp')
     token = os.environ.get('GITHUB_TOKEN', '')
     output_file = os.environ.get('OUTPUT_FILE', 'index.html')
+    data_file = os.environ.get('DATA_FILE', '')
+    stylesheet_file = os.environ.get('STYLESHEET_FILE', '')
+    cache_dir = os.environ.get('CACHE_DIR', '.cache')
     fetch_sparklines = os.environ.get('FETCH_SPARKLINES', 'true').lower() == 'true'
     fetch_metadata = os.environ.get('FETCH_METADATA', 'true').lower() == 'true'
+    skip_if_unchanged = os.environ.get('SKIP_IF_UNCHANGED', 'false').lower() == 'true'
+    precompress = os.environ.get('PRECOMPRESS', 'false').lower() == 'true'
     max_workers = 20
     try:
         max_workers = int(os.environ.get('MAX_WORKERS', '20'))
     except ValueError:
         print("Warning: MAX_WORKERS is not a valid integer, defaulting to 20", file=sys.stderr)
+    max_requests = 8
+    try:
+        max_requests = int(os.environ.get('MAX_CONCURRENT_REQUESTS', '8'))
+    except ValueError:
+        print("Warning: MAX_CONCURRENT_REQUESTS is not a valid integer, defaulting to 8", file=sys.stderr)
+    set_request_concurrency(max_requests)
+
+    if cache_dir:
+        load_cache(cache_dir)
+        load_repo_store(cache_dir)
 
     print(f"Fetching repositories for organization: {org}")
-    repos = fetch_repos(org, token)
-    print(f"Found {len(repos)} repositories")
-
-    if (fetch_sparklines and token) or (fetch_metadata and token):
-        print(f"Fetching extra data for {len(repos)} repositories using {max_workers} parallel workers...")
-        completed = 0
-        total = len(repos)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    _fetch_repo_extra_data, repo, org, token, fetch_sparklines, fetch_metadata
-                ): repo
-                for repo in repos
-            }
+    repos = None
+    fingerprint = None
+    if skip_if_unchanged and cache_dir:
+        # Every listing page answering 304 means no repository was created,
+        # pushed to or edited since the cached copy, so neither was anything
+        # the page shows (pushes update sparklines, commits and index.md).
+        fingerprint = run_fingerprint(org, output_file, data_file, stylesheet_file, fetch_sparklines, fetch_metadata)
+        listing, unchanged = _fetch_repos_listing(org, token)
+        outputs_exist = all(os.path.exists(path) for path in filter(None, (output_file, data_file, stylesheet_file)))
+        if unchanged and outputs_exist and load_last_run(cache_dir) == fingerprint:
+            print(f"Repository listing unchanged since the last run, keeping {output_file}")
+            return
+        if not token:
+            repos = listing
+
+    fetch_extra = bool(token and (fetch_sparklines or fetch_metadata))
+    # Each repository's requests are independent, so they are scheduled
+    # individually rather than one repository per worker; a repository's
+    # stats, index.md, PR count and latest commit then load in parallel.
+    # Scheduling starts as soon as a listing page arrives, so the remaining
+    # pages are fetched while the first repositories' details already load.
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) if fetch_extra else None
+    futures = {}
+    # (full_name, field) -> value fetched for an abandoned GraphQL listing
+    fetched = {}
+
+    def schedule(page: List[Dict]) -> None:
+        if executor is None:
+            return
+        for repo in page:
+            for field, fetch in _plan_repo_requests(repo, org, token, fetch_sparklines, fetch_metadata):
+                key = (repo.get("full_name"), field)
+                if key in fetched:
+                    repo[field] = fetched[key]
+                else:
+                    futures[executor.submit(fetch)] = (repo, field)
+
+    try:
+        if repos is None and token:
+            try:
+                repos = []
+                for page in iter_repos_graphql(org, token, with_metadata=fetch_metadata):
+                    repos.extend(page)
+                    schedule(page)
+            except Exception as exc:
+                print(f"Warning: GraphQL listing failed ({exc}), falling back to the REST API", file=sys.stderr)
+                # Requests not yet started for the partial listing are
+                # cancelled. Those already running are waited for, and every
+                # successful result is kept for the REST listing's repositories.
+                for future in futures:
+                    future.cancel()
+                started = [future for future in futures if not future.cancelled()]
+                for future in concurrent.futures.as_completed(started):
+                    if future.exception() is None:
+                        repo, field = futures[future]
+                        fetched[(repo.get("full_name"), field)] = future.result()
+                repos = None
+                futures.clear()
+            if repos is not None:
+                print(f"Found {len(repos)} repositories")
+        if repos is None:
+            repos = fetch_repos(org, token)
+            print(f"Found {len(repos)} repositories")
+            if executor is not None and fetch_metadata:
+                _prefetch_metadata(repos, org, token, executor)
+            schedule(repos)
+
+        if fetch_extra:
+            total = len(repos)
+            pending_repos = len({id(repo) for repo, _ in futures.values()})
+            print(f"Fetching extra data for {total} repositories using {max_workers} parallel workers "
+                  f"({max_requests} concurrent requests)...")
+            print(f"  {len(futures)} requests needed; {total - pending_repos} repositories need none")
+
+            completed = 0
             for future in concurrent.futures.as_completed(futures):
+                repo, field = futures[future]
                 try:
-                    future.result()  # re-raises any exception; repo dict is modified in place
+                    # A failed request leaves the field at its empty default
+                    repo[field] = future.result()
                 except Exception as exc:
-                    failed_repo = futures[future]
-                    print(f"  Warning: failed to fetch extra data for {failed_repo.get('name', '?')}: {exc}", file=sys.stderr)
+                    print(f"  Warning: failed to fetch {field} for {repo.get('name', '?')}: {exc}", file=sys.stderr)
                 completed += 1
-                if completed % 100 == 0 or completed == total:
-                    print(f"  Completed {completed}/{total}")
+                if completed % 250 == 0 or completed == len(futures):
+                    print(f"  Completed {completed}/{len(futures)} requests")
 
-        print(f"  Done fetching extra data for {total} repositories")
-    else:
-        print("Skipping extra data fetch (no token or both FETCH_SPARKLINES and FETCH_METADATA are false)")
-        for repo in repos:
-            repo["sparkline"] = []
-            repo["index_md"] = {}
-            repo["open_prs_count"] = 0
-            repo["last_commit"] = {}
+            print(f"  Done fetching extra data for {total} repositories")
+        else:
+            print("Skipping extra data fetch (no token or both FETCH_SPARKLINES and FETCH_METADATA are false)")
+            for repo in repos:
+                repo["sparkline"] = []
+                repo["index_md"] = {}
+                repo.setdefault("open_prs_count", 0)
+                repo["last_commit"] = {}
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     print("Generating HTML page...")
-    html = generate_html(repos, org.upper())
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # The page requests its data and stylesheet relative to its own location
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    data_url = None
+    if data_file:
+        write_repo_data(repos, data_file)
+        data_url = Path(os.path.relpath(os.path.abspath(data_file), output_dir)).as_posix()
+        print(f"Repository data written: {data_file}")
+    stylesheet_url = None
+    if stylesheet_file:
+        Path(stylesheet_file).write_text(PAGE_CSS, encoding="utf-8")
+        stylesheet_url = Path(os.path.relpath(os.path.abspath(stylesheet_file), output_dir)).as_posix()
+        print(f"Stylesheet written: {stylesheet_file}")
+    write_html(output_file, repos, org.upper(), data_url, stylesheet_url)
 
     print(f"HTML page generated: {output_file}")
 
+    if precompress:
+        for path in filter(None, (output_file, data_file, stylesheet_file)):
+            gz_path = write_gzip_copy(path)
+            print(f"Compressed copy written: {gz_path} ({os.path.getsize(gz_path)} of {os.path.getsize(path)} bytes)")
+
+    if cache_dir:
+        save_cache(cache_dir)
+        save_repo_store(cache_dir, repos, bool(fetch_metadata and token))
+        print(f"API response cache saved to {cache_dir} "
+              f"({_cache_stats['not_modified']} of {_cache_stats['conditional']} conditional requests not modified)")
+        if fingerprint:
+            save_last_run(cache_dir, fingerprint)
+
 if __name__ == "__main__":
     main()